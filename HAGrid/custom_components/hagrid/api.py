@@ -3,15 +3,76 @@ from __future__ import annotations
 
 import asyncio
 import base64
+import hashlib
+import json
 import logging
 import math
+import random
+import re
+import sys
+import time
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+from contextlib import asynccontextmanager
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
-from typing import Any
-from xml.etree import ElementTree as ET
+from email.utils import parsedate_to_datetime
+from functools import lru_cache, wraps
+from itertools import islice, takewhile
+from operator import itemgetter
+from types import MappingProxyType
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterator, Mapping
+from zoneinfo import ZoneInfo
 
 import aiohttp
+import numpy as np
+
+try:
+    import orjson
+
+    # C decoder that reads bytes directly (no intermediate str decode)
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+try:
+    from lxml import etree as ET
+
+    # libxml2 C parser; never allow unbounded text nodes from remote documents
+    _XML_PARSER_OPTIONS: dict[str, Any] = {
+        "huge_tree": False,
+        "remove_blank_text": True,
+        "resolve_entities": False,
+        "collect_ids": False,
+    }
+except ImportError:
+    from xml.etree import ElementTree as ET
+
+    _XML_PARSER_OPTIONS = {}
+
+try:
+    from ciso8601 import parse_datetime as _parse_datetime
+except ImportError:
+    # Python 3.11+ fromisoformat also accepts the Z suffix
+    _parse_datetime = datetime.fromisoformat
+
+try:
+    import simdjson
+
+    # Reused across Overpass queries so its internal buffers are amortised
+    _SIMDJSON_PARSER: simdjson.Parser | None = simdjson.Parser()
+except ImportError:
+    _SIMDJSON_PARSER = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
 
 from .const import (
     CARBON_INTENSITY_API,
@@ -40,11 +101,445 @@ from .const import (
     ENTSOE_AREAS,
     AUSTRALIA_REGIONS,
 )
+from .geo import geojson_line_latlon, osgb_to_latlon
 
 _LOGGER = logging.getLogger(__name__)
 
 
-@dataclass
+if msgspec is not None:
+
+    class _B1610Row(msgspec.Struct, frozen=True, gc=False):
+        """One B1610 row, decoded and type-checked in C by msgspec."""
+
+        ngcBmUnitId: str | None = None
+        bmUnitId: str = ""
+        fuelType: str | None = None
+        quantity: float = 0.0
+        settlementDate: str | None = None
+        settlementPeriod: int = 0
+        registeredResourceName: str | None = None
+
+    class _B1610Response(msgspec.Struct, gc=False):
+        """B1610 dataset envelope."""
+
+        data: list[_B1610Row] = []
+
+    _B1610_DECODER: msgspec.json.Decoder | None = msgspec.json.Decoder(_B1610Response)
+else:
+    _B1610_DECODER = None
+
+
+# Transport failures and undecodable bodies; anything else is a bug and
+# should surface rather than be logged as a failed request
+_REQUEST_ERRORS = (aiohttp.ClientError, asyncio.TimeoutError, ValueError)
+
+
+async def _json(response: aiohttp.ClientResponse) -> Any:
+    """Decode a JSON response body straight from bytes."""
+    return _loads(await response.read())
+
+
+@lru_cache(maxsize=4096)
+def _parse_iso(value: str) -> datetime:
+    """Parse an ISO 8601 timestamp (including a trailing Z).
+    
+    Memoised: the same period boundaries recur across regions, rows and
+    refreshes, and the returned datetimes are immutable so can be shared.
+    """
+    return _parse_datetime(value)
+
+
+# (monotonic tick, UTC datetime) behind _now_utc
+_NOW_CACHE: list[Any] = [-math.inf, None]
+
+
+def _now_utc() -> datetime:
+    """Return the current UTC time, refreshed at most once a second.
+    
+    For record timestamps stamped at fetch time, where a second of
+    staleness is invisible; never use it for expiry arithmetic.
+    """
+    tick = time.monotonic()
+    if tick - _NOW_CACHE[0] >= 1.0:
+        _NOW_CACHE[0] = tick
+        _NOW_CACHE[1] = datetime.now(timezone.utc)
+    return _NOW_CACHE[1]
+
+
+# GB settlement days run from local (Europe/London) midnight
+_GB_TZ = ZoneInfo("Europe/London")
+
+
+@lru_cache(maxsize=128)
+def _settlement_period_start(settlement_date: str, settlement_period: int) -> datetime:
+    """Return the UTC start of a GB settlement period.
+    
+    Periods are 30 minutes counted from local midnight, so clock-change
+    days (46 or 50 periods) resolve correctly. Cached so every row in the
+    same period shares one datetime object.
+    """
+    midnight = datetime.fromisoformat(settlement_date[:10]).replace(tzinfo=_GB_TZ)
+    offset = timedelta(minutes=30 * max(settlement_period - 1, 0))
+    return midnight.astimezone(timezone.utc) + offset
+
+
+def _float_or_nan(value: Any) -> float:
+    """Parse a numeric field, mapping missing or malformed values to NaN."""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return math.nan
+
+
+def _display_name(names: Mapping[str, Mapping[str, str]], code: str) -> str:
+    """Return the display name for a zone/region code, or the code itself."""
+    info = names.get(code)
+    return info.get("name", code) if info else code
+
+
+def _intern(value: Any) -> Any:
+    """Intern a small-vocabulary string so repeated values share one object."""
+    return sys.intern(value) if type(value) is str else value
+
+
+# Shared read-only default for tag/extra-data fields that are usually empty
+_EMPTY_TAGS: Mapping[str, Any] = MappingProxyType({})
+
+
+def _empty_tags() -> Mapping[str, Any]:
+    """Return the shared empty mapping (dataclass default factory)."""
+    return _EMPTY_TAGS
+
+
+def _intern_tags(tags: Mapping[str, Any]) -> Mapping[str, Any]:
+    """Copy an OSM tag mapping with interned keys and values."""
+    if not tags:
+        return _EMPTY_TAGS
+    return {sys.intern(k): _intern(v) for k, v in tags.items()}
+
+
+def _extra_data(**values: Any) -> Mapping[str, Any]:
+    """Collect optional extra fields, sharing one empty mapping when all are unset."""
+    extra = {k: v for k, v in values.items() if v is not None}
+    return extra or _EMPTY_TAGS
+
+
+_MAX_AGE_RE = re.compile(r"max-age=(\d+)")
+
+
+class _ResponseCache:
+    """In-memory TTL cache for upstream responses keyed by URL + params.
+    
+    Polls that land inside an endpoint's update interval are answered
+    without a round trip. The ETag is stored with each entry so an expired
+    entry can be revalidated with If-None-Match; a 304 reply refreshes it
+    without transferring or parsing the payload again.
+    
+    Cached values are handed to every caller as is and must be treated
+    as read-only.
+    """
+    
+    def __init__(self, maxsize: int = 256) -> None:
+        """Initialize the cache."""
+        self._maxsize = maxsize
+        # key -> (expires at (monotonic), etag, value)
+        self._entries: OrderedDict[tuple, tuple[float, str | None, Any]] = OrderedDict()
+    
+    @staticmethod
+    def key(
+        url: str,
+        params: Mapping[str, Any] | None = None,
+        identity: str | None = None,
+    ) -> tuple:
+        """Build a cache key from a URL and its query parameters.
+        
+        Args:
+            url: Request URL
+            params: Query parameters
+            identity: Credential fingerprint for endpoints whose response
+                depends on a header-borne API key or token, so config
+                entries with different credentials never share an entry
+        """
+        key = (url, *sorted((k, str(v)) for k, v in params.items())) if params else (url,)
+        return key if identity is None else (*key, identity)
+    
+    def get(self, key: tuple) -> Any | None:
+        """Get a cached value if it is still fresh."""
+        entry = self._entries.get(key)
+        if entry is None or entry[0] < time.monotonic():
+            return None
+        self._entries.move_to_end(key)
+        return entry[2]
+    
+    def conditional_headers(self, key: tuple) -> dict[str, str]:
+        """Get If-None-Match headers for revalidating a stale entry."""
+        entry = self._entries.get(key)
+        if entry is None or entry[1] is None:
+            return {}
+        return {"If-None-Match": entry[1]}
+    
+    @staticmethod
+    def _lifetime(headers: Mapping[str, str], ttl: float) -> float | None:
+        """Get how long to keep a response, or None if it must not be stored.
+        
+        The caller's TTL is a ceiling: an upstream max-age can shorten it
+        but never stretch live data past its poll interval or turn an
+        ETag-only (ttl=0) entry into a fresh one.
+        """
+        cache_control = headers.get("Cache-Control", "")
+        if "no-store" in cache_control:
+            return None
+        if (match := _MAX_AGE_RE.search(cache_control)) is not None:
+            return min(int(match.group(1)), ttl)
+        return ttl
+    
+    def revalidate(self, key: tuple, ttl: float, headers: Mapping[str, str]) -> Any | None:
+        """Extend a stale entry after a 304 Not Modified reply."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        lifetime = self._lifetime(headers, ttl)
+        if lifetime is None:
+            del self._entries[key]
+        else:
+            self._entries[key] = (time.monotonic() + lifetime, entry[1], entry[2])
+        return entry[2]
+    
+    def put(
+        self,
+        key: tuple,
+        value: Any,
+        headers: Mapping[str, str],
+        ttl: float,
+    ) -> None:
+        """Store a response, honouring Cache-Control no-store / max-age."""
+        if (lifetime := self._lifetime(headers, ttl)) is None:
+            return
+        self._entries[key] = (time.monotonic() + lifetime, headers.get("ETag"), value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+
+
+# Shared by all clients so every config entry benefits from the same polls
+_RESPONSE_CACHE = _ResponseCache()
+
+
+def _credential_id(*secrets: str) -> str:
+    """Fingerprint credentials for use in a cache key without storing them."""
+    return hashlib.sha256(":".join(secrets).encode()).hexdigest()[:16]
+
+# Cache lifetimes (seconds) by how often the upstream data changes
+CACHE_TTL_SETTLEMENT = 60  # Half-hourly settlement-period / live data
+CACHE_TTL_FORECAST = 300  # Forecasts and hourly series
+CACHE_TTL_REFERENCE = 1800  # Asset registers (substations, lines, sites)
+CACHE_TTL_STATIC = 6 * 3600  # Reference lists (BM units, fuel types)
+CACHE_TTL_PRICES = 900  # Day-ahead auction prices
+
+
+def _ttl_cached(
+    ttl: float,
+) -> Callable[[Callable[..., Awaitable[Any]]], Callable[..., Awaitable[Any]]]:
+    """Memoise an async client method per instance and arguments.
+    
+    Results live in the instance's ``_reference_cache`` keyed by method
+    name and arguments. A miss is fetched under a per-key lock from
+    ``_reference_locks``, so concurrent identical callers share one request
+    while different calls still run in parallel. None and empty
+    lists/dicts are not stored, so a failed fetch is retried next poll.
+    Both maps are created on the instance by the first decorated call.
+    
+    Args:
+        ttl: Seconds a stored result stays fresh
+    """
+    def decorator(func: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+        name = func.__name__
+        
+        @wraps(func)
+        async def wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+            key = (name, *args, *sorted(kwargs.items())) if kwargs else (name, *args)
+            state = vars(self)
+            # (method name, *args) -> (result, monotonic fetch time)
+            cache: dict[tuple, tuple[Any, float]] = state.setdefault("_reference_cache", {})
+            cached = cache.get(key)
+            if cached is not None and time.monotonic() - cached[1] < ttl:
+                return cached[0]
+            
+            locks: dict[tuple, asyncio.Lock] = state.setdefault("_reference_locks", {})
+            if (lock := locks.get(key)) is None:
+                lock = locks[key] = asyncio.Lock()
+            async with lock:
+                # Another caller may have filled it while we waited
+                cached = cache.get(key)
+                now = time.monotonic()
+                if cached is not None and now - cached[1] < ttl:
+                    return cached[0]
+                result = await func(self, *args, **kwargs)
+                if result is not None and (not isinstance(result, (list, dict)) or result):
+                    cache[key] = (result, now)
+                return result
+        
+        return wrapper
+    
+    return decorator
+
+
+def _single_flight(
+    func: Callable[..., Awaitable[Any]],
+) -> Callable[..., Awaitable[Any]]:
+    """Share one in-flight request among concurrent identical callers.
+    
+    Calls with equal arguments that arrive while the first is still
+    running await its result (via the instance's ``_inflight`` map, created
+    on first use) instead of issuing their own request; this covers the
+    window before the response cache is filled. The map is per client,
+    so only callers sharing the same credentials are coalesced, and all
+    of them receive the same result object, which must not be mutated.
+    """
+    def hashable(value: Any) -> Any:
+        return _ResponseCache.key("", value) if isinstance(value, Mapping) else value
+    
+    @wraps(func)
+    async def wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+        key = tuple(map(hashable, args))
+        if kwargs:
+            key += tuple((name, hashable(value)) for name, value in sorted(kwargs.items()))
+        inflight: dict[tuple, asyncio.Future[Any]] = vars(self).setdefault("_inflight", {})
+        if (future := inflight.get(key)) is not None:
+            # Shielded so one cancelled waiter does not cancel the others
+            return await asyncio.shield(future)
+        
+        future = asyncio.get_running_loop().create_future()
+        inflight[key] = future
+        result = None
+        try:
+            result = await func(self, *args, **kwargs)
+            return result
+        finally:
+            del inflight[key]
+            # Waiters see None (a failed request) if the owner was cancelled
+            future.set_result(result)
+    
+    return wrapper
+
+
+async def _gather_partial(
+    coros: Mapping[str, Awaitable[Any]],
+    timeout: float,
+) -> dict[str, Any]:
+    """Run named fetches concurrently and keep whatever finishes in time.
+    
+    Fetches still running at the deadline are cancelled so one slow
+    endpoint cannot hold a whole breakdown to its latency.
+    
+    Args:
+        coros: Name -> coroutine for each part of the breakdown
+        timeout: Seconds to wait for the slowest part
+        
+    Returns:
+        Dict of name -> result; None for parts that failed or timed out
+    """
+    tasks = {name: asyncio.ensure_future(coro) for name, coro in coros.items()}
+    try:
+        _, pending = await asyncio.wait(tasks.values(), timeout=timeout)
+    except asyncio.CancelledError:
+        for task in tasks.values():
+            task.cancel()
+        raise
+    for task in pending:
+        task.cancel()
+    
+    out: dict[str, Any] = {}
+    for name, task in tasks.items():
+        if task in pending:
+            _LOGGER.debug("Fetch for %s timed out after %ss", name, timeout)
+            out[name] = None
+        elif (error := task.exception()) is not None:
+            _LOGGER.debug("Fetch for %s failed: %s", name, error)
+            out[name] = None
+        else:
+            out[name] = task.result()
+    return out
+
+
+# Slowest part a multi-request breakdown will wait for before going partial
+_BREAKDOWN_DEADLINE = 10.0
+
+
+# Transient statuses worth another attempt; other 4xx are final
+_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+_RETRY_ATTEMPTS = 4
+# Total seconds one request may spend sleeping between attempts; the
+# coordinator refresh awaits every source, so a flapping host must not
+# hold it open for long
+_RETRY_BUDGET = 5.0
+
+
+def _retry_delay(response: aiohttp.ClientResponse, attempt: int) -> float | None:
+    """Return how long to wait before retrying, or None to give up.
+    
+    Args:
+        response: The transient (429/5xx) response
+        attempt: Zero-based attempt number that produced it
+        
+    Returns:
+        Delay in seconds including jitter; None if Retry-After asks for
+        longer than the whole retry budget
+    """
+    delay = 0.5 * 2**attempt
+    if retry_after := response.headers.get("Retry-After"):
+        try:
+            delay = float(retry_after)
+        except ValueError:
+            try:
+                delay = (
+                    parsedate_to_datetime(retry_after) - datetime.now(timezone.utc)
+                ).total_seconds()
+            except (TypeError, ValueError):
+                pass
+        if delay > _RETRY_BUDGET:
+            return None
+    return max(delay, 0.0) + random.uniform(0, 0.5)
+
+
+@asynccontextmanager
+async def _get_with_retry(
+    get: Callable[..., Any],
+    url: str,
+    **kwargs: Any,
+) -> AsyncIterator[aiohttp.ClientResponse]:
+    """GET a URL, retrying 429 and 5xx responses with backoff and jitter.
+    
+    Used in place of ``async with session.get(...)``; the final response
+    (successful, non-transient or out of attempts) is yielded as is.
+    Retrying stops early once the next sleep would take the total past
+    _RETRY_BUDGET, so a failing source costs the refresh seconds, not
+    minutes.
+    
+    Args:
+        get: Bound session.get of the calling client
+        url: Request URL
+        **kwargs: Passed through to get (params, headers, timeout)
+    """
+    slept = 0.0
+    for attempt in range(_RETRY_ATTEMPTS):
+        response = await get(url, **kwargs)
+        if response.status not in _RETRY_STATUSES or attempt == _RETRY_ATTEMPTS - 1:
+            break
+        delay = _retry_delay(response, attempt)
+        if delay is None or slept + delay > _RETRY_BUDGET:
+            break
+        response.release()
+        _LOGGER.debug("Retrying %s in %.1fs after HTTP %s", url, delay, response.status)
+        await asyncio.sleep(delay)
+        slept += delay
+    try:
+        yield response
+    finally:
+        response.release()
+
+
+@dataclass(slots=True, frozen=True)
 class CarbonIntensityData:
     """Carbon intensity data."""
     
@@ -55,7 +550,7 @@ class CarbonIntensityData:
     to_time: datetime
 
 
-@dataclass
+@dataclass(slots=True)
 class GenerationMix:
     """Generation mix data."""
     
@@ -63,7 +558,7 @@ class GenerationMix:
     percentage: float
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RegionalData:
     """Regional grid data."""
     
@@ -74,7 +569,7 @@ class RegionalData:
     generation_mix: list[GenerationMix] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class Substation:
     """Substation data."""
     
@@ -87,21 +582,21 @@ class Substation:
     capacity_mva: float | None = None
     customer_count: int | None = None
     address: str | None = None
-    extra_data: dict[str, Any] = field(default_factory=dict)
+    extra_data: Mapping[str, Any] = field(default_factory=_empty_tags)
 
 
-@dataclass
+@dataclass(slots=True)
 class PowerLine:
     """Power line data."""
     
     id: str
     line_type: str  # 33kv, hv, lv
-    coordinates: list[tuple[float, float]]  # List of (lat, lon) pairs
+    coordinates: np.ndarray  # (n, 2) array of (lat, lon) pairs
     voltage: str | None = None
     circuit_id: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class LiveFault:
     """Live fault/power cut data."""
     
@@ -117,7 +612,7 @@ class LiveFault:
     description: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class EmbeddedGeneration:
     """Embedded generation/storage site."""
     
@@ -132,7 +627,7 @@ class EmbeddedGeneration:
     status: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class OSMPowerFeature:
     """OpenStreetMap power infrastructure feature."""
     
@@ -144,11 +639,11 @@ class OSMPowerFeature:
     longitude: float
     voltage: str | None = None
     operator: str | None = None
-    tags: dict[str, str] = field(default_factory=dict)
+    tags: Mapping[str, str] = field(default_factory=_empty_tags)
     geometry: list[tuple[float, float]] | None = None  # For ways
 
 
-@dataclass
+@dataclass(slots=True)
 class SystemData:
     """Real-time system data from NESO/Energy Dashboard."""
     
@@ -158,7 +653,7 @@ class SystemData:
     transfers_mw: dict[str, float] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class BMUnit:
     """Balancing Mechanism Unit - Individual generation/demand unit."""
     
@@ -171,7 +666,7 @@ class BMUnit:
     longitude: float | None = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class GenerationUnit:
     """Real-time generation output for a specific unit."""
     
@@ -183,7 +678,7 @@ class GenerationUnit:
     name: str | None = None
 
 
-@dataclass 
+@dataclass(slots=True, frozen=True)
 class FuelTypeGeneration:
     """Generation output aggregated by fuel type."""
     
@@ -193,7 +688,7 @@ class FuelTypeGeneration:
     percentage: float | None = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class InterconnectorFlow:
     """Power flow through an interconnector."""
     
@@ -206,7 +701,7 @@ class InterconnectorFlow:
     utilization_pct: float | None = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SystemFrequency:
     """Real-time system frequency."""
     
@@ -214,7 +709,7 @@ class SystemFrequency:
     timestamp: datetime
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DemandData:
     """National/transmission demand data."""
     
@@ -224,7 +719,7 @@ class DemandData:
     settlement_period: int | None = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CircuitFlow:
     """Power flow in a metered circuit (aggregated view)."""
     
@@ -234,15 +729,15 @@ class CircuitFlow:
     flow_mw: float
     capacity_mw: float | None
     direction: str  # "in", "out", "bidirectional"
-    fuel_type: str | None = None
     timestamp: datetime
+    fuel_type: str | None = None
 
 
 # ========================================
 # GLOBAL DATA STRUCTURES
 # ========================================
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ZoneCarbonIntensity:
     """Carbon intensity data for any global zone."""
     
@@ -256,7 +751,7 @@ class ZoneCarbonIntensity:
     data_source: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ZonePowerBreakdown:
     """Power generation breakdown for any global zone."""
     
@@ -272,7 +767,7 @@ class ZonePowerBreakdown:
     renewable_percentage: float | None = None  # Percentage of generation from renewables
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CrossBorderFlow:
     """Power flow between two zones/countries."""
     
@@ -283,7 +778,7 @@ class CrossBorderFlow:
     data_source: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PriceData:
     """Electricity price data."""
     
@@ -296,6 +791,55 @@ class PriceData:
     data_source: str
 
 
+class HAGridHTTP:
+    """Pooled HTTP session shared by every HAGrid API client.
+    
+    One connector means DNS lookups, TCP connections and TLS sessions are
+    reused across sources and refreshes, so fetches issued concurrently
+    with asyncio.gather only pay for the round trip. The session is
+    created lazily on first use.
+    
+    Clients must be handed this session rather than opening their own
+    or one per call; a private session would get a cold pool and redo
+    the handshakes on every refresh.
+    """
+    
+    def __init__(self) -> None:
+        """Initialize the holder."""
+        self._session: aiohttp.ClientSession | None = None
+    
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        """Get the shared session, creating it if needed."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=64,
+                    # Above every client's in-flight cap, so a fan-out to one
+                    # host (e.g. the Elexon snapshot) never queues here.
+                    # aiohttp speaks HTTP/1.1 only; warm keep-alive
+                    # connections stand in for HTTP/2 multiplexing
+                    limit_per_host=16,
+                    # Grid API hosts are stable; re-resolve every 10 minutes
+                    ttl_dns_cache=600,
+                    # Keep idle connections (and their TLS sessions) open
+                    # long enough to be reused across a whole refresh
+                    keepalive_timeout=75,
+                ),
+                # Slow sources (ENTSO-E, Overpass) override this per request;
+                # the connect cap stops one unreachable host from holding a
+                # pool slot for the full request budget
+                timeout=aiohttp.ClientTimeout(total=30, connect=10),
+            )
+        return self._session
+    
+    async def close(self) -> None:
+        """Close the shared session."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+
 class GridAPIClient(ABC):
     """Abstract base class for grid API clients."""
     
@@ -322,6 +866,105 @@ class GridAPIClient(ABC):
         pass
 
 
+def _period_bounds(period: Mapping[str, Any]) -> tuple[datetime, datetime]:
+    """Parse a Carbon Intensity period's from/to (now if missing)."""
+    from_time = period.get("from")
+    to_time = period.get("to")
+    if from_time and to_time:
+        return _parse_iso(from_time), _parse_iso(to_time)
+    now = datetime.now()
+    return (
+        _parse_iso(from_time) if from_time else now,
+        _parse_iso(to_time) if to_time else now,
+    )
+
+
+def _locate_region(data: dict) -> tuple[dict, dict, dict]:
+    """Find the region and its readings in any Carbon Intensity response.
+    
+    Handles the three shapes the API returns:
+    - {"data": [{from, to, "regions": [{region + readings}]}]} (/regional)
+    - {"data": [{region, "data": [{from, to, readings}]}]} (postcode/regionid)
+    - {"data": [{from, to, readings}]} or {"data": {...}} (national)
+    
+    Returns:
+        Tuple of (region, readings, period carrying from/to)
+    """
+    entry = data["data"]
+    if isinstance(entry, list):
+        entry = entry[0]
+    
+    if "regions" in entry:
+        region = entry["regions"][0]
+        return region, region, entry
+    if entry.get("data"):
+        readings = entry["data"][0]
+        return entry, readings, readings
+    return entry, entry, entry
+
+
+def _intensity_from(
+    readings: Mapping[str, Any],
+    from_time: datetime,
+    to_time: datetime,
+) -> CarbonIntensityData:
+    """Build intensity data from a readings entry."""
+    intensity = readings.get("intensity") or _EMPTY_TAGS
+    return CarbonIntensityData(
+        forecast=intensity.get("forecast", 0),
+        actual=intensity.get("actual"),
+        index=_intern(intensity.get("index", "moderate")),
+        from_time=from_time,
+        to_time=to_time,
+    )
+
+
+def _generation_mix_from(readings: Mapping[str, Any]) -> list[GenerationMix]:
+    """Build the generation mix from a readings entry."""
+    return [
+        GenerationMix(_intern(item["fuel"]), item["perc"])
+        for item in readings.get("generationmix", ())
+    ]
+
+
+def _region_from(
+    region: Mapping[str, Any],
+    readings: Mapping[str, Any],
+    from_time: datetime,
+    to_time: datetime,
+) -> RegionalData:
+    """Build regional data from a located region and its readings."""
+    return RegionalData(
+        region_id=region.get("regionid", 0),
+        dno_region=region.get("dnoregion", "Unknown"),
+        short_name=region.get("shortname", "Unknown"),
+        intensity=_intensity_from(readings, from_time, to_time),
+        generation_mix=_generation_mix_from(readings),
+    )
+
+
+@lru_cache(maxsize=2)
+def _slot_iso(slot: int) -> str:
+    """Format a UTC epoch second as the API's minute-precision timestamp."""
+    return time.strftime("%Y-%m-%dT%H:%MZ", time.gmtime(slot))
+
+
+def _now_slot_iso() -> str:
+    """Start of the current half-hour slot, formatted for forecast URLs.
+    
+    Quantising to the API's native 30 minute granularity keeps forecast
+    URLs identical for the whole slot, so concurrent callers share one
+    formatted string and repeat requests hit the response cache.
+    """
+    return _slot_iso(int(time.time() // 1800) * 1800)
+
+
+# Forecast endpoint templates, filled in a single format_map call
+_FORECAST_POSTCODE = "/regional/intensity/{now}/fw{hours}h/postcode/{postcode}"
+_FORECAST_REGION = "/regional/intensity/{now}/fw{hours}h/regionid/{region_id}"
+_FORECAST_NATIONAL = "/intensity/{now}/fw{hours}h"
+
+
 class CarbonIntensityClient(GridAPIClient):
     """Client for UK Carbon Intensity API (NESO)."""
     
@@ -330,16 +973,33 @@ class CarbonIntensityClient(GridAPIClient):
         super().__init__(session)
         self.base_url = CARBON_INTENSITY_API
     
-    async def _request(self, endpoint: str) -> dict | None:
-        """Make a request to the API."""
+    async def _request(
+        self,
+        endpoint: str,
+        ttl: float = CACHE_TTL_SETTLEMENT,
+    ) -> dict | None:
+        """Make a request to the API (cached for ttl seconds)."""
         url = f"{self.base_url}{endpoint}"
+        key = _RESPONSE_CACHE.key(url)
+        if (cached := _RESPONSE_CACHE.get(key)) is not None:
+            return cached
+        
         try:
-            async with self.session.get(url) as response:
+            async with self.session.get(
+                url, headers=_RESPONSE_CACHE.conditional_headers(key)
+            ) as response:
+                if response.status == 304:
+                    return _RESPONSE_CACHE.revalidate(key, ttl, response.headers)
                 if response.status == 200:
-                    return await response.json()
-                _LOGGER.error("Carbon Intensity API error: %s", response.status)
+                    data = await _json(response)
+                    _RESPONSE_CACHE.put(key, data, response.headers, ttl)
+                    return data
+                if response.status >= 500:
+                    _LOGGER.warning("Carbon Intensity API unavailable: %s", response.status)
+                else:
+                    _LOGGER.error("Carbon Intensity API error: %s", response.status)
                 return None
-        except Exception as e:
+        except _REQUEST_ERRORS as e:
             _LOGGER.error("Carbon Intensity API request failed: %s", e)
             return None
     
@@ -361,30 +1021,9 @@ class CarbonIntensityClient(GridAPIClient):
             return None
         
         try:
-            # Handle different response formats
-            if "regions" in data["data"][0]:
-                # Regional response
-                region = data["data"][0]["regions"][0]
-                intensity_data = region.get("intensity", {})
-            elif "data" in data["data"][0]:
-                # Postcode response
-                intensity_data = data["data"][0]["data"][0].get("intensity", {})
-            else:
-                # National response
-                intensity_data = data["data"][0].get("intensity", {})
-            
-            return CarbonIntensityData(
-                forecast=intensity_data.get("forecast", 0),
-                actual=intensity_data.get("actual"),
-                index=intensity_data.get("index", "moderate"),
-                from_time=datetime.fromisoformat(
-                    data["data"][0].get("from", "").replace("Z", "+00:00")
-                ),
-                to_time=datetime.fromisoformat(
-                    data["data"][0].get("to", "").replace("Z", "+00:00")
-                ),
-            )
-        except (KeyError, IndexError, ValueError) as e:
+            _, readings, period = _locate_region(data)
+            return _intensity_from(readings, *_period_bounds(period))
+        except (KeyError, IndexError, TypeError, ValueError) as e:
             _LOGGER.error("Error parsing carbon intensity data: %s", e)
             return None
     
@@ -406,19 +1045,9 @@ class CarbonIntensityClient(GridAPIClient):
             return []
         
         try:
-            # Extract generation mix from response
-            if "regions" in data["data"][0]:
-                mix_data = data["data"][0]["regions"][0].get("generationmix", [])
-            elif "data" in data["data"][0]:
-                mix_data = data["data"][0]["data"][0].get("generationmix", [])
-            else:
-                mix_data = data["data"][0].get("generationmix", [])
-            
-            return [
-                GenerationMix(fuel=item["fuel"], percentage=item["perc"])
-                for item in mix_data
-            ]
-        except (KeyError, IndexError) as e:
+            _, readings, _ = _locate_region(data)
+            return _generation_mix_from(readings)
+        except (KeyError, IndexError, TypeError) as e:
             _LOGGER.error("Error parsing generation mix: %s", e)
             return []
     
@@ -440,46 +1069,8 @@ class CarbonIntensityClient(GridAPIClient):
             return None
         
         try:
-            if "regions" in data["data"][0]:
-                region = data["data"][0]["regions"][0]
-                from_time = data["data"][0].get("from", "")
-                to_time = data["data"][0].get("to", "")
-            else:
-                region = data["data"][0]
-                from_time = region.get("data", [{}])[0].get("from", "")
-                to_time = region.get("data", [{}])[0].get("to", "")
-                if "data" in region:
-                    intensity_source = region["data"][0]
-                else:
-                    intensity_source = region
-            
-            intensity_data = region.get("intensity", {})
-            if "data" in region and region["data"]:
-                intensity_data = region["data"][0].get("intensity", intensity_data)
-            
-            generation_mix = []
-            mix_data = region.get("generationmix", [])
-            if "data" in region and region["data"]:
-                mix_data = region["data"][0].get("generationmix", mix_data)
-            
-            for item in mix_data:
-                generation_mix.append(
-                    GenerationMix(fuel=item["fuel"], percentage=item["perc"])
-                )
-            
-            return RegionalData(
-                region_id=region.get("regionid", 0),
-                dno_region=region.get("dnoregion", "Unknown"),
-                short_name=region.get("shortname", "Unknown"),
-                intensity=CarbonIntensityData(
-                    forecast=intensity_data.get("forecast", 0),
-                    actual=intensity_data.get("actual"),
-                    index=intensity_data.get("index", "moderate"),
-                    from_time=datetime.fromisoformat(from_time.replace("Z", "+00:00")) if from_time else datetime.now(),
-                    to_time=datetime.fromisoformat(to_time.replace("Z", "+00:00")) if to_time else datetime.now(),
-                ),
-                generation_mix=generation_mix,
-            )
+            region, readings, period = _locate_region(data)
+            return _region_from(region, readings, *_period_bounds(period))
         except Exception as e:
             _LOGGER.error("Error parsing regional data: %s", e)
             return None
@@ -490,36 +1081,17 @@ class CarbonIntensityClient(GridAPIClient):
         if not data or "data" not in data:
             return []
         
-        regions = []
         try:
-            for region_data in data["data"][0].get("regions", []):
-                intensity_data = region_data.get("intensity", {})
-                generation_mix = [
-                    GenerationMix(fuel=item["fuel"], percentage=item["perc"])
-                    for item in region_data.get("generationmix", [])
-                ]
-                
-                regions.append(RegionalData(
-                    region_id=region_data.get("regionid", 0),
-                    dno_region=region_data.get("dnoregion", "Unknown"),
-                    short_name=region_data.get("shortname", "Unknown"),
-                    intensity=CarbonIntensityData(
-                        forecast=intensity_data.get("forecast", 0),
-                        actual=intensity_data.get("actual"),
-                        index=intensity_data.get("index", "moderate"),
-                        from_time=datetime.fromisoformat(
-                            data["data"][0].get("from", "").replace("Z", "+00:00")
-                        ),
-                        to_time=datetime.fromisoformat(
-                            data["data"][0].get("to", "").replace("Z", "+00:00")
-                        ),
-                    ),
-                    generation_mix=generation_mix,
-                ))
+            # Every region shares the same period; parse its bounds once
+            period = data["data"][0]
+            from_time, to_time = _period_bounds(period)
+            return [
+                _region_from(region, region, from_time, to_time)
+                for region in period.get("regions", [])
+            ]
         except Exception as e:
             _LOGGER.error("Error parsing all regions: %s", e)
-        
-        return regions
+            return []
     
     async def get_intensity_forecast(
         self,
@@ -529,18 +1101,20 @@ class CarbonIntensityClient(GridAPIClient):
     ) -> list[CarbonIntensityData]:
         """Get carbon intensity forecast."""
         if postcode:
-            endpoint = f"/regional/intensity/{{now}}/fw{hours}h/postcode/{postcode}"
+            template = _FORECAST_POSTCODE
         elif region_id:
-            endpoint = f"/regional/intensity/{{now}}/fw{hours}h/regionid/{region_id}"
+            template = _FORECAST_REGION
         else:
-            endpoint = f"/intensity/{{now}}/fw{hours}h"
+            template = _FORECAST_NATIONAL
         
-        # Replace {now} with actual datetime
-        from datetime import timezone
-        now = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%MZ")
-        endpoint = endpoint.replace("{now}", now)
+        endpoint = template.format_map({
+            "now": _now_slot_iso(),
+            "hours": hours,
+            "postcode": postcode,
+            "region_id": region_id,
+        })
         
-        data = await self._request(endpoint)
+        data = await self._request(endpoint, ttl=CACHE_TTL_FORECAST)
         if not data or "data" not in data:
             return []
         
@@ -558,13 +1132,57 @@ class CarbonIntensityClient(GridAPIClient):
                     forecast=intensity.get("forecast", 0),
                     actual=intensity.get("actual"),
                     index=intensity.get("index", "moderate"),
-                    from_time=datetime.fromisoformat(item.get("from", "").replace("Z", "+00:00")),
-                    to_time=datetime.fromisoformat(item.get("to", "").replace("Z", "+00:00")),
+                    from_time=_parse_iso(item.get("from", "")),
+                    to_time=_parse_iso(item.get("to", "")),
                 ))
         except Exception as e:
             _LOGGER.error("Error parsing intensity forecast: %s", e)
         
         return forecasts
+    
+    async def refresh_all(
+        self,
+        postcode: str | None = None,
+        region_id: int | None = None,
+        hours: int = 24,
+    ) -> dict[str, Any]:
+        """Fetch everything a refresh needs from this API concurrently.
+        
+        All regions are always fetched; the local region and its forecast
+        are added when a postcode or region is given.
+        
+        Returns:
+            Dict with "all_regions" and, for a location, "regional_data"
+            and "forecast"
+        """
+        if not (postcode or region_id):
+            return {"all_regions": await self.get_all_regions()}
+        
+        all_regions, regional_data, forecast = await asyncio.gather(
+            self.get_all_regions(),
+            self.get_regional_data(postcode=postcode, region_id=region_id),
+            self.get_intensity_forecast(hours=hours, postcode=postcode, region_id=region_id),
+        )
+        return {
+            "all_regions": all_regions,
+            "regional_data": regional_data,
+            "forecast": forecast,
+        }
+
+
+# Live fault fields, fetched in one C-level call per record
+_FAULT_DEFAULTS: dict[str, Any] = {
+    "incidentreference": None,
+    "incidenttype": "unknown",
+    "status": "unknown",
+    "postcodearea": "",
+    "estimatedrestoredcustomers": 0,
+    "creationdatetime": None,
+    "estimatedrestorationdate": None,
+    "statusdescription": None,
+    "geo_point_2d": None,
+}
+_fault_fields = itemgetter(*_FAULT_DEFAULTS)
 
 
 class UKPNClient(GridAPIClient):
@@ -582,8 +1200,13 @@ class UKPNClient(GridAPIClient):
         offset: int = 0,
         where: str | None = None,
         select: str | None = None,
+        ttl: float = CACHE_TTL_SETTLEMENT,
     ) -> dict | None:
-        """Make a request to the UKPN API."""
+        """Make a request to the UKPN API (cached for ttl seconds).
+        
+        The cache key covers limit, offset, where and select, so each
+        distinct query is cached separately.
+        """
         url = f"{self.base_url}/catalog/datasets/{dataset}/records"
         params: dict[str, Any] = {
             "limit": limit,
@@ -594,16 +1217,54 @@ class UKPNClient(GridAPIClient):
         if select:
             params["select"] = select
         
+        key = _RESPONSE_CACHE.key(url, params)
+        if (cached := _RESPONSE_CACHE.get(key)) is not None:
+            return cached
+        
         try:
-            async with self.session.get(url, params=params) as response:
+            async with self.session.get(
+                url, params=params, headers=_RESPONSE_CACHE.conditional_headers(key)
+            ) as response:
+                if response.status == 304:
+                    return _RESPONSE_CACHE.revalidate(key, ttl, response.headers)
                 if response.status == 200:
-                    return await response.json()
-                _LOGGER.error("UKPN API error: %s", response.status)
+                    data = await _json(response)
+                    _RESPONSE_CACHE.put(key, data, response.headers, ttl)
+                    return data
+                if response.status >= 500:
+                    _LOGGER.warning("UKPN API unavailable: %s", response.status)
+                else:
+                    _LOGGER.error("UKPN API error: %s", response.status)
                 return None
-        except Exception as e:
+        except _REQUEST_ERRORS as e:
             _LOGGER.error("UKPN API request failed: %s", e)
             return None
     
+    @staticmethod
+    def _bbox_where(bbox: tuple[float, float, float, float] | None) -> str | None:
+        """Build an indexed rectangle filter for a (min_lat, min_lon, max_lat, max_lon) bbox."""
+        if not bbox:
+            return None
+        # ODSQL in_bbox takes the two corners as lat, lon pairs
+        return f"in_bbox(geo_point_2d, {bbox[0]}, {bbox[1]}, {bbox[2]}, {bbox[3]})"
+    
+    @staticmethod
+    def _iter_records(data: dict) -> Iterator[tuple[str, dict]]:
+        """Yield (record id, fields) pairs from a records response.
+        
+        The response shape is checked once up front: the v2.0 Explore API
+        wraps each result as {"record": {"id", "fields"}}, while v2.1 returns
+        the fields flat on the result itself.
+        """
+        results = data["results"]
+        if results and "record" in results[0]:
+            for result in results:
+                record = result.get("record") or {}
+                yield str(record.get("id", "")), record.get("fields", result)
+        else:
+            for result in results:
+                yield "", result
+    
     async def get_carbon_intensity(
         self, 
         postcode: str | None = None,
@@ -627,21 +1288,29 @@ class UKPNClient(GridAPIClient):
             return []
         
         faults = []
-        for record in data["results"]:
-            fields = record.get("record", {}).get("fields", record)
+        now = datetime.now()
+        for record_id, fields in self._iter_records(data):
             try:
-                geo = fields.get("geo_point_2d", {})
+                try:
+                    values = _fault_fields(fields)
+                except KeyError:
+                    # Sparse record: fill the missing keys from the defaults
+                    values = _fault_fields({**_FAULT_DEFAULTS, **fields})
+                (
+                    ref, incident_type, status, area, customers,
+                    created, restore, description, geo,
+                ) = values
                 faults.append(LiveFault(
-                    id=fields.get("incidentreference", str(record.get("record", {}).get("id", ""))),
-                    incident_type=fields.get("incidenttype", "unknown"),
-                    status=fields.get("status", "unknown"),
-                    postcode_area=fields.get("postcodearea", ""),
-                    estimated_customers=int(fields.get("estimatedrestoredcustomers", 0)),
-                    start_time=datetime.fromisoformat(fields.get("creationdatetime", "").replace("Z", "+00:00")) if fields.get("creationdatetime") else datetime.now(),
-                    estimated_restore_time=datetime.fromisoformat(fields.get("estimatedrestorationdate", "").replace("Z", "+00:00")) if fields.get("estimatedrestorationdate") else None,
+                    id=ref if ref is not None else record_id,
+                    incident_type=_intern(incident_type),
+                    status=_intern(status),
+                    postcode_area=area,
+                    estimated_customers=int(customers),
+                    start_time=_parse_iso(created) if created else now,
+                    estimated_restore_time=_parse_iso(restore) if restore else None,
                     latitude=geo.get("lat") if geo else None,
                     longitude=geo.get("lon") if geo else None,
-                    description=fields.get("statusdescription"),
+                    description=description,
                 ))
             except Exception as e:
                 _LOGGER.debug("Error parsing fault record: %s", e)
@@ -655,39 +1324,35 @@ class UKPNClient(GridAPIClient):
         bbox: tuple[float, float, float, float] | None = None,
     ) -> list[Substation]:
         """Get grid and primary substation data."""
-        where = None
-        if bbox:
-            # bbox = (min_lat, min_lon, max_lat, max_lon)
-            where = f"within_distance(geo_point_2d, geom'POINT({bbox[1]} {bbox[0]})', {bbox[3]-bbox[1]}km)"
-        
         data = await self._request(
             UKPN_DATASETS["grid_primary_sites"], 
             limit=limit,
-            where=where,
+            where=self._bbox_where(bbox),
+            ttl=CACHE_TTL_REFERENCE,
         )
         if not data or "results" not in data:
             return []
         
         substations = []
-        for record in data["results"]:
-            fields = record.get("record", {}).get("fields", record)
+        for record_id, fields in self._iter_records(data):
+            get = fields.get
             try:
-                geo = fields.get("geo_point_2d", {})
+                geo = get("geo_point_2d")
                 if not geo:
                     continue
                 
                 substations.append(Substation(
-                    id=str(fields.get("gsp_gis_id", record.get("record", {}).get("id", ""))),
-                    name=fields.get("substation_name", "Unknown"),
-                    substation_type="grid" if fields.get("substation_type", "").lower() == "grid" else "primary",
+                    id=str(get("gsp_gis_id", record_id)),
+                    name=get("substation_name", "Unknown"),
+                    substation_type="grid" if get("substation_type", "").lower() == "grid" else "primary",
                     latitude=geo.get("lat", 0),
                     longitude=geo.get("lon", 0),
-                    voltage=fields.get("voltage"),
-                    capacity_mva=fields.get("installed_capacity_mva"),
-                    extra_data={
-                        "licence_area": fields.get("licence_area"),
-                        "dno_area": fields.get("dno_area"),
-                    },
+                    voltage=_intern(get("voltage")),
+                    capacity_mva=get("installed_capacity_mva"),
+                    extra_data=_extra_data(
+                        licence_area=get("licence_area"),
+                        dno_area=get("dno_area"),
+                    ),
                 ))
             except Exception as e:
                 _LOGGER.debug("Error parsing substation record: %s", e)
@@ -701,39 +1366,36 @@ class UKPNClient(GridAPIClient):
         bbox: tuple[float, float, float, float] | None = None,
     ) -> list[Substation]:
         """Get secondary substation data."""
-        where = None
-        if bbox:
-            where = f"within_distance(geo_point_2d, geom'POINT({bbox[1]} {bbox[0]})', {bbox[3]-bbox[1]}km)"
-        
         data = await self._request(
             UKPN_DATASETS["secondary_sites"],
             limit=limit,
-            where=where,
+            where=self._bbox_where(bbox),
+            ttl=CACHE_TTL_REFERENCE,
         )
         if not data or "results" not in data:
             return []
         
         substations = []
-        for record in data["results"]:
-            fields = record.get("record", {}).get("fields", record)
+        for record_id, fields in self._iter_records(data):
+            get = fields.get
             try:
-                geo = fields.get("geo_point_2d", {})
+                geo = get("geo_point_2d")
                 if not geo:
                     continue
                 
                 substations.append(Substation(
-                    id=str(fields.get("asset_id", record.get("record", {}).get("id", ""))),
-                    name=fields.get("substation_name", "Unknown"),
+                    id=str(get("asset_id", record_id)),
+                    name=get("substation_name", "Unknown"),
                     substation_type="secondary",
                     latitude=geo.get("lat", 0),
                     longitude=geo.get("lon", 0),
-                    capacity_mva=fields.get("onan_rating_kva", 0) / 1000 if fields.get("onan_rating_kva") else None,
-                    customer_count=fields.get("customer_count"),
-                    address=fields.get("address"),
-                    extra_data={
-                        "indoor_outdoor": fields.get("indoor_outdoor"),
-                        "primary_feeder": fields.get("primary_feeder"),
-                    },
+                    capacity_mva=rating_kva / 1000 if (rating_kva := get("onan_rating_kva")) else None,
+                    customer_count=get("customer_count"),
+                    address=get("address"),
+                    extra_data=_extra_data(
+                        indoor_outdoor=get("indoor_outdoor"),
+                        primary_feeder=get("primary_feeder"),
+                    ),
                 ))
             except Exception as e:
                 _LOGGER.debug("Error parsing secondary substation: %s", e)
@@ -750,33 +1412,31 @@ class UKPNClient(GridAPIClient):
         data = await self._request(
             UKPN_DATASETS["33kv_overhead_lines"],
             limit=limit,
+            where=self._bbox_where(bbox),
+            ttl=CACHE_TTL_REFERENCE,
         )
         if not data or "results" not in data:
             return []
         
         lines = []
-        for record in data["results"]:
-            fields = record.get("record", {}).get("fields", record)
+        for record_id, fields in self._iter_records(data):
+            get = fields.get
             try:
-                geo_shape = fields.get("geo_shape", {})
+                geo_shape = get("geo_shape")
                 if not geo_shape or "coordinates" not in geo_shape:
                     continue
                 
                 # Convert coordinates from [lon, lat] to (lat, lon)
-                coords = geo_shape.get("coordinates", [])
-                if geo_shape.get("type") == "LineString":
-                    coordinates = [(c[1], c[0]) for c in coords]
-                elif geo_shape.get("type") == "MultiLineString":
-                    coordinates = [(c[1], c[0]) for segment in coords for c in segment]
-                else:
+                coordinates = geojson_line_latlon(geo_shape)
+                if coordinates is None:
                     continue
                 
                 lines.append(PowerLine(
-                    id=str(record.get("record", {}).get("id", "")),
+                    id=record_id,
                     line_type="33kv",
                     coordinates=coordinates,
                     voltage="33kV",
-                    circuit_id=fields.get("circuit_id"),
+                    circuit_id=get("circuit_id"),
                 ))
             except Exception as e:
                 _LOGGER.debug("Error parsing 33kV line: %s", e)
@@ -793,32 +1453,30 @@ class UKPNClient(GridAPIClient):
         data = await self._request(
             UKPN_DATASETS["hv_overhead_lines"],
             limit=limit,
+            where=self._bbox_where(bbox),
+            ttl=CACHE_TTL_REFERENCE,
         )
         if not data or "results" not in data:
             return []
         
         lines = []
-        for record in data["results"]:
-            fields = record.get("record", {}).get("fields", record)
+        for record_id, fields in self._iter_records(data):
+            get = fields.get
             try:
-                geo_shape = fields.get("geo_shape", {})
+                geo_shape = get("geo_shape")
                 if not geo_shape or "coordinates" not in geo_shape:
                     continue
                 
-                coords = geo_shape.get("coordinates", [])
-                if geo_shape.get("type") == "LineString":
-                    coordinates = [(c[1], c[0]) for c in coords]
-                elif geo_shape.get("type") == "MultiLineString":
-                    coordinates = [(c[1], c[0]) for segment in coords for c in segment]
-                else:
+                coordinates = geojson_line_latlon(geo_shape)
+                if coordinates is None:
                     continue
                 
                 lines.append(PowerLine(
-                    id=str(record.get("record", {}).get("id", "")),
+                    id=record_id,
                     line_type="hv",
                     coordinates=coordinates,
-                    voltage=fields.get("voltage", "HV"),
-                    circuit_id=fields.get("circuit_id"),
+                    voltage=_intern(get("voltage", "HV")),
+                    circuit_id=get("circuit_id"),
                 ))
             except Exception as e:
                 _LOGGER.debug("Error parsing HV line: %s", e)
@@ -840,63 +1498,195 @@ class UKPNClient(GridAPIClient):
             UKPN_DATASETS["embedded_capacity"],
             limit=limit,
             where=where,
+            ttl=CACHE_TTL_REFERENCE,
         )
         if not data or "results" not in data:
             return []
         
         sites = []
-        for record in data["results"]:
-            fields = record.get("record", {}).get("fields", record)
+        for record_id, fields in self._iter_records(data):
+            get = fields.get
             try:
-                geo = fields.get("geo_point_2d", {})
+                geo = get("geo_point_2d")
                 if not geo:
                     continue
                 
                 sites.append(EmbeddedGeneration(
-                    id=str(fields.get("ecr_ref", record.get("record", {}).get("id", ""))),
-                    name=fields.get("site_name", "Unknown"),
-                    technology=fields.get("technology_type", "unknown"),
-                    capacity_mw=float(fields.get("installed_capacity_mw", 0)),
-                    export_capacity_mw=float(fields.get("export_capacity_mw", 0)) if fields.get("export_capacity_mw") else None,
+                    id=str(get("ecr_ref", record_id)),
+                    name=get("site_name", "Unknown"),
+                    technology=_intern(get("technology_type", "unknown")),
+                    capacity_mw=float(get("installed_capacity_mw", 0)),
+                    export_capacity_mw=float(export_mw) if (export_mw := get("export_capacity_mw")) else None,
                     latitude=geo.get("lat", 0),
                     longitude=geo.get("lon", 0),
-                    connection_voltage=fields.get("connection_voltage"),
-                    status=fields.get("status"),
+                    connection_voltage=_intern(get("connection_voltage")),
+                    status=_intern(get("status")),
                 ))
             except Exception as e:
                 _LOGGER.debug("Error parsing embedded generation: %s", e)
                 continue
         
         return sites
+    
+    async def get_network_bundle(
+        self,
+        bbox: tuple[float, float, float, float] | None = None,
+    ) -> dict[str, list | None]:
+        """Fetch substations, lines and embedded generation concurrently.
+        
+        A failed dataset is logged and reported as None (rather than an
+        empty list) so callers can keep their previous copy.
+        
+        Returns:
+            Dict with "substations", "lines" and "generation" entries
+        """
+        results = await asyncio.gather(
+            self.get_grid_primary_substations(limit=200, bbox=bbox),
+            self.get_secondary_substations(limit=500, bbox=bbox),
+            self.get_overhead_lines_33kv(limit=200, bbox=bbox),
+            self.get_overhead_lines_hv(limit=200, bbox=bbox),
+            self.get_embedded_generation(limit=200),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, BaseException):
+                _LOGGER.debug("UKPN dataset fetch failed: %s", result)
+        grid, secondary, lines_33kv, lines_hv, generation = (
+            None if isinstance(result, BaseException) else result for result in results
+        )
+        
+        return {
+            "substations": grid + secondary if grid is not None and secondary is not None else None,
+            "lines": lines_33kv + lines_hv if lines_33kv is not None and lines_hv is not None else None,
+            "generation": generation,
+        }
+
+
+_LAT_DEG_PER_KM = 1 / 111.0
+
+
+@lru_cache(maxsize=256)
+def _degrees_per_km(lat: float) -> tuple[float, float]:
+    """Approximate (latitude, longitude) degrees per km at a latitude.
+    
+    Callers round the latitude so repeat queries around the same home
+    location hit the cache.
+    """
+    return _LAT_DEG_PER_KM, _LAT_DEG_PER_KM / math.cos(math.radians(lat))
+
+
+# Overpass QL skeletons, rendered with a (south, west, north, east) bbox.
+# The global [bbox:...] setting applies to every statement, so only the
+# four coordinates vary per request.
+_OVERPASS_BBOX = "[out:json][timeout:30][bbox:%.6f,%.6f,%.6f,%.6f];"
+_OVERPASS_POWER = (
+    'node["power"="substation"];way["power"="substation"];'
+    'node["power"="plant"];way["power"="plant"];'
+    'node["power"="generator"];node["power"="tower"];'
+)
+_OVERPASS_LINES = 'way["power"="line"];way["power"="minor_line"];'
+_OVERPASS_POWER_QUERY = f"{_OVERPASS_BBOX}({_OVERPASS_POWER});out center;"
+_OVERPASS_POWER_LINES_QUERY = f"{_OVERPASS_BBOX}({_OVERPASS_POWER}{_OVERPASS_LINES});out center;"
+_OVERPASS_SUBSTATIONS_QUERY = (
+    f"{_OVERPASS_BBOX}"
+    '(node["power"="substation"];way["power"="substation"];relation["power"="substation"];);'
+    "out center tags;"
+)
 
 
 class OverpassClient:
     """Client for OpenStreetMap Overpass API - power infrastructure."""
     
+    # Overpass queries routinely run longer than the session default
+    _TIMEOUT = aiohttp.ClientTimeout(total=60)
+    
+    # Responses at least this large (or unsized) are streamed when ijson is available
+    _STREAM_MIN_BYTES = 1 << 20
+    
     def __init__(self, session: aiohttp.ClientSession) -> None:
         """Initialize the client."""
         self.session = session
         self.base_url = OVERPASS_API
     
-    async def _query(self, query: str) -> dict | None:
-        """Execute an Overpass query."""
+    @staticmethod
+    def _log_status(status: int) -> None:
+        """Log a non-200 Overpass reply at a level matching its cause."""
+        if status in (429, 504):
+            # Overpass sheds load with these; the next refresh retries
+            _LOGGER.warning("Overpass API busy: %s", status)
+        else:
+            _LOGGER.error("Overpass API error: %s", status)
+    
+    async def _query(self, query: str) -> Any:
+        """Execute an Overpass query.
+        
+        With pysimdjson installed the (often multi-MB) response is parsed
+        on demand, so only the fields read by the element parsers are
+        ever materialised as Python objects.
+        """
         try:
             async with self.session.post(
                 self.base_url,
                 data={"data": query},
-                timeout=aiohttp.ClientTimeout(total=60),
+                timeout=self._TIMEOUT,
             ) as response:
                 if response.status == 200:
-                    return await response.json()
-                _LOGGER.error("Overpass API error: %s", response.status)
+                    body = await response.read()
+                    if _SIMDJSON_PARSER is not None:
+                        try:
+                            return _SIMDJSON_PARSER.parse(body)
+                        except RuntimeError:
+                            # Parser still referenced by a previous document
+                            pass
+                    return _loads(body)
+                self._log_status(response.status)
                 return None
         except asyncio.TimeoutError:
             _LOGGER.error("Overpass API timeout")
             return None
-        except Exception as e:
+        except _REQUEST_ERRORS as e:
             _LOGGER.error("Overpass API request failed: %s", e)
             return None
     
+    async def _iter_elements(self, query: str) -> AsyncIterator[Mapping[str, Any]]:
+        """Yield the elements of an Overpass query result.
+        
+        With ijson installed, large or chunked responses are parsed as the
+        bytes arrive, so features can be built before the download ends
+        and the full document is never held in memory. Small responses,
+        or any response without ijson, go through _query.
+        """
+        if ijson is None:
+            data = await self._query(query)
+            if data and "elements" in data:
+                for element in data["elements"]:
+                    yield element
+            return
+        
+        try:
+            async with self.session.post(
+                self.base_url,
+                data={"data": query},
+                timeout=self._TIMEOUT,
+            ) as response:
+                if response.status != 200:
+                    self._log_status(response.status)
+                    return
+                length = response.content_length
+                if length is not None and length < self._STREAM_MIN_BYTES:
+                    data = _loads(await response.read())
+                    for element in data.get("elements", []):
+                        yield element
+                    return
+                async for element in ijson.items_async(
+                    response.content, "elements.item", use_float=True
+                ):
+                    yield element
+        except asyncio.TimeoutError:
+            _LOGGER.error("Overpass API timeout")
+        except (*_REQUEST_ERRORS, ijson.JSONError) as e:
+            _LOGGER.error("Overpass API request failed: %s", e)
+    
     def _build_bbox(
         self,
         lat: float,
@@ -904,9 +1694,9 @@ class OverpassClient:
         radius_km: float,
     ) -> tuple[float, float, float, float]:
         """Build bounding box from center point and radius."""
-        # Approximate degrees per km
-        lat_delta = radius_km / 111.0
-        lon_delta = radius_km / (111.0 * math.cos(math.radians(lat)))
+        lat_per_km, lon_per_km = _degrees_per_km(round(lat, 2))
+        lat_delta = radius_km * lat_per_km
+        lon_delta = radius_km * lon_per_km
         
         return (
             lat - lat_delta,  # south
@@ -915,6 +1705,48 @@ class OverpassClient:
             lon + lon_delta,  # east
         )
     
+    @staticmethod
+    def _parse_element(
+        element: Mapping[str, Any],
+        power_type: str | None = None,
+        allow_relations: bool = False,
+    ) -> OSMPowerFeature | None:
+        """Build a feature from an Overpass element.
+        
+        Ways (and relations, if allowed) are placed at their "out center"
+        point. Returns None for other element types or elements without a
+        position, so callers filter instead of catching per element.
+        """
+        get = element.get
+        osm_type = get("type", "node")
+        if osm_type == "node":
+            position = element
+        elif osm_type == "way" or allow_relations:
+            position = get("center")
+            if not position:
+                return None
+        else:
+            return None
+        
+        lat = position.get("lat")
+        lon = position.get("lon")
+        if lat is None or lon is None:
+            return None
+        
+        tags = get("tags") or _EMPTY_TAGS
+        tag = tags.get
+        return OSMPowerFeature(
+            osm_id=get("id", 0),
+            osm_type=_intern(osm_type),
+            power_type=power_type or _intern(tag("power", "unknown")),
+            name=tag("name"),
+            latitude=lat,
+            longitude=lon,
+            voltage=_intern(tag("voltage")),
+            operator=_intern(tag("operator")),
+            tags=_intern_tags(tags),
+        )
+    
     async def get_power_infrastructure(
         self,
         lat: float,
@@ -926,65 +1758,18 @@ class OverpassClient:
         bbox = self._build_bbox(lat, lon, radius_km)
         
         # Build Overpass QL query for power infrastructure
-        query = f"""
-        [out:json][timeout:30];
-        (
-          node["power"="substation"]({bbox[0]},{bbox[1]},{bbox[2]},{bbox[3]});
-          way["power"="substation"]({bbox[0]},{bbox[1]},{bbox[2]},{bbox[3]});
-          node["power"="plant"]({bbox[0]},{bbox[1]},{bbox[2]},{bbox[3]});
-          way["power"="plant"]({bbox[0]},{bbox[1]},{bbox[2]},{bbox[3]});
-          node["power"="generator"]({bbox[0]},{bbox[1]},{bbox[2]},{bbox[3]});
-          node["power"="tower"]({bbox[0]},{bbox[1]},{bbox[2]},{bbox[3]});
-        """
-        
-        if include_lines:
-            query += f"""
-          way["power"="line"]({bbox[0]},{bbox[1]},{bbox[2]},{bbox[3]});
-          way["power"="minor_line"]({bbox[0]},{bbox[1]},{bbox[2]},{bbox[3]});
-            """
-        
-        query += """
-        );
-        out center;
-        """
+        template = _OVERPASS_POWER_LINES_QUERY if include_lines else _OVERPASS_POWER_QUERY
+        query = template % bbox
         
-        data = await self._query(query)
-        if not data or "elements" not in data:
+        try:
+            return [
+                feature
+                async for element in self._iter_elements(query)
+                if (feature := self._parse_element(element)) is not None
+            ]
+        except (KeyError, TypeError, ValueError) as e:
+            _LOGGER.error("Error parsing OSM elements: %s", e)
             return []
-        
-        features: list[OSMPowerFeature] = []
-        for element in data["elements"]:
-            try:
-                osm_type = element.get("type", "node")
-                tags = element.get("tags", {})
-                
-                # Get coordinates (center for ways)
-                if osm_type == "node":
-                    lat_val = element.get("lat", 0)
-                    lon_val = element.get("lon", 0)
-                elif osm_type == "way":
-                    center = element.get("center", {})
-                    lat_val = center.get("lat", 0)
-                    lon_val = center.get("lon", 0)
-                else:
-                    continue
-                
-                features.append(OSMPowerFeature(
-                    osm_id=element.get("id", 0),
-                    osm_type=osm_type,
-                    power_type=tags.get("power", "unknown"),
-                    name=tags.get("name"),
-                    latitude=lat_val,
-                    longitude=lon_val,
-                    voltage=tags.get("voltage"),
-                    operator=tags.get("operator"),
-                    tags=tags,
-                ))
-            except Exception as e:
-                _LOGGER.debug("Error parsing OSM element: %s", e)
-                continue
-        
-        return features
     
     async def get_substations(
         self,
@@ -995,50 +1780,18 @@ class OverpassClient:
         """Get substations within radius."""
         bbox = self._build_bbox(lat, lon, radius_km)
         
-        query = f"""
-        [out:json][timeout:30];
-        (
-          node["power"="substation"]({bbox[0]},{bbox[1]},{bbox[2]},{bbox[3]});
-          way["power"="substation"]({bbox[0]},{bbox[1]},{bbox[2]},{bbox[3]});
-          relation["power"="substation"]({bbox[0]},{bbox[1]},{bbox[2]},{bbox[3]});
-        );
-        out center tags;
-        """
+        query = _OVERPASS_SUBSTATIONS_QUERY % bbox
         
-        data = await self._query(query)
-        if not data or "elements" not in data:
+        try:
+            return [
+                feature
+                async for element in self._iter_elements(query)
+                if (feature := self._parse_element(element, "substation", True)) is not None
+            ]
+        except (KeyError, TypeError, ValueError) as e:
+            _LOGGER.error("Error parsing OSM substations: %s", e)
             return []
-        
-        substations: list[OSMPowerFeature] = []
-        for element in data["elements"]:
-            try:
-                tags = element.get("tags", {})
-                osm_type = element.get("type", "node")
-                
-                if osm_type == "node":
-                    lat_val = element.get("lat", 0)
-                    lon_val = element.get("lon", 0)
-                else:
-                    center = element.get("center", {})
-                    lat_val = center.get("lat", 0)
-                    lon_val = center.get("lon", 0)
-                
-                substations.append(OSMPowerFeature(
-                    osm_id=element.get("id", 0),
-                    osm_type=osm_type,
-                    power_type="substation",
-                    name=tags.get("name"),
-                    latitude=lat_val,
-                    longitude=lon_val,
-                    voltage=tags.get("voltage"),
-                    operator=tags.get("operator"),
-                    tags=tags,
-                ))
-            except Exception as e:
-                _LOGGER.debug("Error parsing OSM substation: %s", e)
-                continue
-        
-        return substations
+
 
 
 class NESOClient:
@@ -1047,18 +1800,19 @@ class NESOClient:
     def __init__(self, session: aiohttp.ClientSession) -> None:
         """Initialize the client."""
         self.session = session
+        self._get = session.get
         self.base_url = NESO_API_BASE
     
     async def _request(self, endpoint: str, params: dict | None = None) -> dict | None:
         """Make a request to the NESO API."""
         url = f"{self.base_url}/{endpoint}"
         try:
-            async with self.session.get(url, params=params) as response:
+            async with self._get(url, params=params) as response:
                 if response.status == 200:
-                    return await response.json()
+                    return await _json(response)
                 _LOGGER.error("NESO API error: %s", response.status)
                 return None
-        except Exception as e:
+        except _REQUEST_ERRORS as e:
             _LOGGER.error("NESO API request failed: %s", e)
             return None
     
@@ -1095,6 +1849,11 @@ class NESOClient:
 class NationalGridClient:
     """Client for National Grid Connected Data API (CKAN)."""
     
+    # Slow API; keep only a few requests in flight at once
+    _MAX_CONCURRENT = 4
+    
+    _RESOURCE_TTL = 3600
+    
     def __init__(
         self,
         session: aiohttp.ClientSession,
@@ -1102,23 +1861,36 @@ class NationalGridClient:
     ) -> None:
         """Initialize the client."""
         self.session = session
+        self._get = session.get
         self.base_url = NATIONAL_GRID_API_BASE
         self.api_key = api_key
+        self._headers = {"Authorization": api_key} if api_key else {}
+        self._semaphore = asyncio.Semaphore(self._MAX_CONCURRENT)
+        # package id -> (latest resource id, monotonic time it was resolved)
+        self._resource_cache: dict[str, tuple[str, float]] = {}
     
     async def _request(self, endpoint: str, params: dict | None = None) -> dict | None:
-        """Make a request to the National Grid API."""
+        """Make a request to the National Grid API (revalidated by ETag)."""
         url = f"{self.base_url}/{endpoint}"
-        headers = {}
-        if self.api_key:
-            headers["Authorization"] = self.api_key
+        key = _RESPONSE_CACHE.key(url, params)
+        if (cached := _RESPONSE_CACHE.get(key)) is not None:
+            return cached
         
         try:
-            async with self.session.get(url, params=params, headers=headers) as response:
+            async with self._semaphore, self._get(
+                url,
+                params=params,
+                headers={**self._headers, **_RESPONSE_CACHE.conditional_headers(key)},
+            ) as response:
+                if response.status == 304:
+                    return _RESPONSE_CACHE.revalidate(key, 0, response.headers)
                 if response.status == 200:
-                    return await response.json()
+                    data = await _json(response)
+                    _RESPONSE_CACHE.put(key, data, response.headers, 0)
+                    return data
                 _LOGGER.error("National Grid API error: %s", response.status)
                 return None
-        except Exception as e:
+        except _REQUEST_ERRORS as e:
             _LOGGER.error("National Grid API request failed: %s", e)
             return None
     
@@ -1129,19 +1901,40 @@ class NationalGridClient:
             return None
         return data.get("result")
     
-    async def get_embedded_capacity_register(self, limit: int = 100) -> list[dict]:
-        """Get embedded capacity register data."""
-        pkg = await self.get_package_info(NATIONAL_GRID_DATASETS["embedded_capacity_register"])
-        if not pkg or not pkg.get("resources"):
-            return []
+    async def _latest_resource_id(self, package_id: str) -> str | None:
+        """Resolve the newest resource of a package, cached for an hour.
+        
+        The resource list only changes when the dataset is republished, so
+        steady-state polls skip the package_show round trip entirely.
+        """
+        cached = self._resource_cache.get(package_id)
+        now = time.monotonic()
+        if cached is not None and now - cached[1] < self._RESOURCE_TTL:
+            return cached[0]
         
-        # Get the latest resource
-        resources = pkg.get("resources", [])
+        pkg = await self.get_package_info(package_id)
+        resources = pkg.get("resources") if pkg else None
         if not resources:
-            return []
+            return None
+        
+        resource_id = resources[-1].get("id")
+        if resource_id:
+            self._resource_cache[package_id] = (resource_id, now)
+        return resource_id
+    
+    async def _fetch_latest_resource(self, package_id: str, limit: int) -> list[dict]:
+        """Fetch records from the newest resource of a package.
         
-        latest_resource = resources[-1]
-        resource_id = latest_resource.get("id")
+        Args:
+            package_id: CKAN package (dataset) id
+            limit: Maximum number of records to return
+            
+        Returns:
+            List of datastore records, empty on failure
+        """
+        resource_id = await self._latest_resource_id(package_id)
+        if not resource_id:
+            return []
         
         params = {
             "resource_id": resource_id,
@@ -1149,52 +1942,55 @@ class NationalGridClient:
         }
         data = await self._request("datastore_search", params)
         if not data or not data.get("success"):
+            # The resource may have been replaced; resolve it again next time
+            self._resource_cache.pop(package_id, None)
             return []
         return data.get("result", {}).get("records", [])
     
+    async def get_embedded_capacity_register(self, limit: int = 100) -> list[dict]:
+        """Get embedded capacity register data."""
+        return await self._fetch_latest_resource(
+            NATIONAL_GRID_DATASETS["embedded_capacity_register"], limit
+        )
+    
     async def get_primary_substations(self, limit: int = 100) -> list[Substation]:
         """Get primary substation locations."""
-        pkg = await self.get_package_info(NATIONAL_GRID_DATASETS["primary_substations"])
-        if not pkg or not pkg.get("resources"):
-            return []
-        
-        resources = pkg.get("resources", [])
-        if not resources:
-            return []
-        
-        latest_resource = resources[-1]
-        resource_id = latest_resource.get("id")
-        
-        params = {
-            "resource_id": resource_id,
-            "limit": limit,
-        }
-        data = await self._request("datastore_search", params)
-        if not data or not data.get("success"):
-            return []
+        records = await self._fetch_latest_resource(
+            NATIONAL_GRID_DATASETS["primary_substations"], limit
+        )
         
-        substations: list[Substation] = []
-        for record in data.get("result", {}).get("records", []):
-            try:
-                # Convert easting/northing to lat/lon (simplified)
-                # For accurate conversion, use pyproj or similar
-                easting = float(record.get("Easting", 0))
-                northing = float(record.get("Northing", 0))
-                
-                # Rough approximation for UK (OSGB36 to WGS84)
-                lat = 49.0 + (northing / 111000)
-                lon = -8.0 + (easting / 80000)
-                
-                substations.append(Substation(
-                    id=str(record.get("_id", "")),
-                    name=record.get("Name", "Unknown"),
-                    substation_type="primary",
-                    latitude=lat,
-                    longitude=lon,
-                ))
-            except Exception as e:
-                _LOGGER.debug("Error parsing NG substation: %s", e)
-                continue
+        # Convert every easting/northing in one batch; unparsable values
+        # become NaN (inf after pyproj) and the record is skipped below
+        count = len(records)
+        eastings = np.fromiter(
+            (_float_or_nan(r.get("Easting")) for r in records),
+            dtype=np.float64,
+            count=count,
+        )
+        northings = np.fromiter(
+            (_float_or_nan(r.get("Northing")) for r in records),
+            dtype=np.float64,
+            count=count,
+        )
+        lats, lons = osgb_to_latlon(eastings, northings)
+        valid = np.isfinite(lats) & np.isfinite(lons)
+        
+        substations = [
+            Substation(
+                id=str(record.get("_id", "")),
+                name=record.get("Name", "Unknown"),
+                substation_type="primary",
+                latitude=lat,
+                longitude=lon,
+            )
+            for record, lat, lon, ok in zip(records, lats.tolist(), lons.tolist(), valid.tolist())
+            if ok
+        ]
+        if len(substations) < count:
+            _LOGGER.debug(
+                "Skipped %d NG substations without a grid reference",
+                count - len(substations),
+            )
         
         return substations
 
@@ -1202,6 +1998,9 @@ class NationalGridClient:
 class SSENNerdaClient:
     """Client for SSEN NERDA API."""
     
+    # Slow API; keep only a few requests in flight at once
+    _MAX_CONCURRENT = 4
+    
     def __init__(
         self,
         session: aiohttp.ClientSession,
@@ -1209,23 +2008,25 @@ class SSENNerdaClient:
     ) -> None:
         """Initialize the client."""
         self.session = session
+        self._get = session.get
         self.base_url = SSEN_NERDA_API_BASE
         self.api_key = api_key
+        self._headers = {"x-api-key": api_key} if api_key else {}
+        self._semaphore = asyncio.Semaphore(self._MAX_CONCURRENT)
     
     async def _request(self, endpoint: str, params: dict | None = None) -> dict | None:
         """Make a request to the SSEN NERDA API."""
         url = f"{self.base_url}/{endpoint}"
-        headers = {}
-        if self.api_key:
-            headers["x-api-key"] = self.api_key
         
         try:
-            async with self.session.get(url, params=params, headers=headers) as response:
+            async with self._semaphore, self._get(
+                url, params=params, headers=self._headers
+            ) as response:
                 if response.status == 200:
-                    return await response.json()
+                    return await _json(response)
                 _LOGGER.error("SSEN NERDA API error: %s", response.status)
                 return None
-        except Exception as e:
+        except _REQUEST_ERRORS as e:
             _LOGGER.error("SSEN NERDA API request failed: %s", e)
             return None
     
@@ -1245,6 +2046,9 @@ class SSENNerdaClient:
 class EnergyDashboardClient:
     """Client for energydashboard.co.uk API."""
     
+    # Slow API; keep only a few requests in flight at once
+    _MAX_CONCURRENT = 4
+    
     def __init__(
         self,
         session: aiohttp.ClientSession,
@@ -1252,23 +2056,25 @@ class EnergyDashboardClient:
     ) -> None:
         """Initialize the client."""
         self.session = session
+        self._get = session.get
         self.base_url = ENERGY_DASHBOARD_API_BASE
         self.api_key = api_key
+        self._headers = {"x-api-key": api_key} if api_key else {}
+        self._semaphore = asyncio.Semaphore(self._MAX_CONCURRENT)
     
     async def _request(self, endpoint: str, params: dict | None = None) -> dict | None:
         """Make a request to the Energy Dashboard API."""
         url = f"{self.base_url}/{endpoint}"
-        headers = {}
-        if self.api_key:
-            headers["x-api-key"] = self.api_key
         
         try:
-            async with self.session.get(url, params=params, headers=headers) as response:
+            async with self._semaphore, self._get(
+                url, params=params, headers=self._headers
+            ) as response:
                 if response.status == 200:
-                    return await response.json()
+                    return await _json(response)
                 _LOGGER.error("Energy Dashboard API error: %s", response.status)
                 return None
-        except Exception as e:
+        except _REQUEST_ERRORS as e:
             _LOGGER.error("Energy Dashboard API request failed: %s", e)
             return None
     
@@ -1285,6 +2091,30 @@ class EnergyDashboardClient:
         return await self._request("demand/latest")
 
 
+# BM unit reference fields, fetched in one C-level call per record
+_BMU_DEFAULTS: dict[str, Any] = {
+    "bmUnitId": "",
+    "bmUnitName": None,
+    "fuelType": "UNKNOWN",
+    "leadPartyName": None,
+    "registeredCapacity": None,
+}
+_bmu_fields = itemgetter(*_BMU_DEFAULTS)
+
+
+def _bmu_values(item: Mapping[str, Any]) -> tuple[Any, ...]:
+    """Fetch the BM unit fields, filling missing keys from the defaults."""
+    try:
+        return _bmu_fields(item)
+    except KeyError:
+        return _bmu_fields({**_BMU_DEFAULTS, **item})
+
+# Reference entry for interconnectors missing from UK_INTERCONNECTORS
+_UNKNOWN_INTERCONNECTOR: Mapping[str, Any] = MappingProxyType(
+    {"name": None, "capacity_mw": 1000, "country": ""}
+)
+
+
 class ElexonBMRSClient:
     """Client for Elexon BMRS API - Granular metered circuit data.
     
@@ -1297,45 +2127,92 @@ class ElexonBMRSClient:
     - Balancing mechanism data
     """
     
+    # Seconds a grid snapshot is shared between the summary/flow views
+    _SNAPSHOT_TTL = 5.0
+    
+    # Cap on in-flight requests so fan-outs cannot drain the shared pool
+    _MAX_CONCURRENT = 8
+    
+    # B1610 responses at least this large (or unsized) are streamed when ijson is available
+    _STREAM_MIN_BYTES = 1 << 20
+    
     def __init__(self, session: aiohttp.ClientSession) -> None:
         """Initialize the client."""
         self.session = session
+        self._get = session.get
         self.base_url = ELEXON_API_BASE
+        self._snapshot_cache: tuple[float, tuple[Any, ...]] | None = None
+        self._snapshot_lock = asyncio.Lock()
+        self._semaphore = asyncio.Semaphore(self._MAX_CONCURRENT)
+    
+    async def _request_raw(
+        self,
+        endpoint: str,
+        params: dict | None = None,
+    ) -> bytes | None:
+        """Make a request to the Elexon BMRS API (returns the raw body)."""
+        url = f"{self.base_url}{endpoint}"
+        
+        try:
+            async with self._semaphore, self._get(url, params=params) as response:
+                if response.status == 200:
+                    return await response.read()
+                _LOGGER.warning("Elexon API error %s: %s", response.status, url)
+                return None
+        except _REQUEST_ERRORS as e:
+            _LOGGER.error("Elexon API request failed: %s", e)
+            return None
     
     async def _request(
         self,
         endpoint: str,
         params: dict | None = None,
+        ttl: float = 0,
     ) -> dict | list | None:
-        """Make a request to the Elexon BMRS API."""
+        """Make a request to the Elexon BMRS API.
+        
+        Responses are revalidated with If-None-Match, so an unchanged
+        payload comes back as an empty 304 and the parsed object from the
+        previous poll is reused.
+        """
         url = f"{self.base_url}{endpoint}"
+        key = _RESPONSE_CACHE.key(url, params)
+        if (cached := _RESPONSE_CACHE.get(key)) is not None:
+            return cached
         
         try:
-            async with self.session.get(url, params=params) as response:
+            async with self._semaphore, self._get(
+                url, params=params, headers=_RESPONSE_CACHE.conditional_headers(key)
+            ) as response:
+                if response.status == 304:
+                    return _RESPONSE_CACHE.revalidate(key, ttl, response.headers)
                 if response.status == 200:
-                    return await response.json()
+                    data = await _json(response)
+                    _RESPONSE_CACHE.put(key, data, response.headers, ttl)
+                    return data
                 _LOGGER.warning("Elexon API error %s: %s", response.status, url)
                 return None
-        except Exception as e:
+        except _REQUEST_ERRORS as e:
             _LOGGER.error("Elexon API request failed: %s", e)
             return None
     
+    @_ttl_cached(CACHE_TTL_STATIC)
     async def get_all_bm_units(self) -> list[BMUnit]:
         """Get all Balancing Mechanism Units (power stations, interconnectors, etc.)."""
         data = await self._request("/reference/bmunits/all")
         if not data or not isinstance(data, list):
             return []
         
-        units = []
-        for item in data:
-            units.append(BMUnit(
-                bm_unit_id=item.get("bmUnitId", ""),
-                name=item.get("bmUnitName"),
-                fuel_type=item.get("fuelType", "UNKNOWN"),
-                lead_party=item.get("leadPartyName"),
-                registered_capacity_mw=item.get("registeredCapacity"),
-            ))
-        return units
+        return [
+            BMUnit(
+                bm_unit_id=unit_id,
+                name=name,
+                fuel_type=_intern(fuel_type),
+                lead_party=_intern(lead_party),
+                registered_capacity_mw=capacity,
+            )
+            for unit_id, name, fuel_type, lead_party, capacity in map(_bmu_values, data)
+        ]
     
     async def get_generation_by_unit(
         self,
@@ -1345,6 +2222,8 @@ class ElexonBMRSClient:
         """Get actual generation output per generation unit (B1610).
         
         This is THE most granular data - individual power station output!
+        With ijson installed, large or chunked responses are parsed record
+        by record as they arrive instead of buffering the whole dump.
         """
         params = {}
         if settlement_date:
@@ -1352,25 +2231,106 @@ class ElexonBMRSClient:
         if settlement_period:
             params["settlementPeriod"] = settlement_period
         
-        # Use the streaming endpoint for latest data
-        data = await self._request("/datasets/B1610", params)
-        if not data or "data" not in data:
+        # One fallback timestamp for every record that lacks a settlement date
+        now = datetime.now(timezone.utc)
+        
+        if ijson is None:
+            body = await self._request_raw("/datasets/B1610", params)
+            return self._parse_generation_units(body, now) if body else []
+        
+        url = f"{self.base_url}/datasets/B1610"
+        try:
+            async with self._semaphore, self._get(url, params=params) as response:
+                if response.status != 200:
+                    _LOGGER.warning("Elexon API error %s: %s", response.status, url)
+                    return []
+                length = response.content_length
+                if length is not None and length < self._STREAM_MIN_BYTES:
+                    body = await response.read()
+                else:
+                    units = []
+                    async for item in ijson.items_async(
+                        response.content, "data.item", use_float=True
+                    ):
+                        unit = self._generation_unit_from_item(item, now)
+                        if unit is not None:
+                            units.append(unit)
+                    return units
+        except (*_REQUEST_ERRORS, ijson.JSONError) as e:
+            _LOGGER.error("Elexon API request failed: %s", e)
+            return []
+        
+        return self._parse_generation_units(body, now) if body else []
+    
+    def _parse_generation_units(self, body: bytes, now: datetime) -> list[GenerationUnit]:
+        """Parse a buffered B1610 response body."""
+        if _B1610_DECODER is not None:
+            try:
+                rows = _B1610_DECODER.decode(body).data
+            except msgspec.DecodeError as e:
+                # Schema drift: fall through to the untyped path below
+                _LOGGER.debug("Typed B1610 decode failed: %s", e)
+            else:
+                return self._generation_units_from_rows(rows, now)
+        
+        try:
+            data = _loads(body)
+        except ValueError as e:
+            _LOGGER.error("Elexon API returned invalid JSON: %s", e)
+            return []
+        if not isinstance(data, dict) or "data" not in data:
             return []
         
         units = []
         for item in data.get("data", []):
+            unit = self._generation_unit_from_item(item, now)
+            if unit is not None:
+                units.append(unit)
+        
+        return units
+    
+    @staticmethod
+    def _generation_unit_from_item(
+        item: Mapping[str, Any],
+        now: datetime,
+    ) -> GenerationUnit | None:
+        """Build a generation unit from an untyped B1610 record."""
+        try:
+            settlement_date = item.get("settlementDate")
+            settlement_period = item.get("settlementPeriod", 0)
+            return GenerationUnit(
+                bm_unit_id=item.get("ngcBmUnitId", item.get("bmUnitId", "")),
+                fuel_type=_intern(item.get("fuelType", "UNKNOWN")),
+                output_mw=float(item.get("quantity", 0)),
+                timestamp=(
+                    _settlement_period_start(settlement_date, int(settlement_period))
+                    if settlement_date else now
+                ),
+                settlement_period=settlement_period,
+                name=item.get("registeredResourceName"),
+            )
+        except (ValueError, TypeError) as e:
+            _LOGGER.debug("Error parsing generation unit: %s", e)
+            return None
+    
+    @staticmethod
+    def _generation_units_from_rows(rows: list[Any], now: datetime) -> list[GenerationUnit]:
+        """Build generation units from msgspec-decoded B1610 rows."""
+        units = []
+        for row in rows:
             try:
                 units.append(GenerationUnit(
-                    bm_unit_id=item.get("ngcBmUnitId", item.get("bmUnitId", "")),
-                    fuel_type=item.get("fuelType", "UNKNOWN"),
-                    output_mw=float(item.get("quantity", 0)),
-                    timestamp=datetime.fromisoformat(
-                        item.get("settlementDate", datetime.now().isoformat())
+                    bm_unit_id=row.ngcBmUnitId or row.bmUnitId,
+                    fuel_type=_intern(row.fuelType or "UNKNOWN"),
+                    output_mw=row.quantity,
+                    timestamp=(
+                        _settlement_period_start(row.settlementDate, row.settlementPeriod)
+                        if row.settlementDate else now
                     ),
-                    settlement_period=item.get("settlementPeriod", 0),
-                    name=item.get("registeredResourceName"),
+                    settlement_period=row.settlementPeriod,
+                    name=row.registeredResourceName,
                 ))
-            except (ValueError, TypeError) as e:
+            except ValueError as e:
                 _LOGGER.debug("Error parsing generation unit: %s", e)
         
         return units
@@ -1397,7 +2357,7 @@ class ElexonBMRSClient:
                 pct = item.get("currentPercentage", item.get("percentage"))
                 
                 generation.append(FuelTypeGeneration(
-                    fuel_type=fuel,
+                    fuel_type=_intern(fuel),
                     output_mw=output,
                     timestamp=now,
                     percentage=float(pct) if pct else None,
@@ -1423,15 +2383,15 @@ class ElexonBMRSClient:
         for item in data.get("data", []):
             try:
                 ic_id = item.get("interconnectorId", item.get("fuelType", ""))
-                ic_info = UK_INTERCONNECTORS.get(ic_id, {})
+                ic_info = UK_INTERCONNECTORS.get(ic_id, _UNKNOWN_INTERCONNECTOR)
                 
                 flow_mw = float(item.get("generation", item.get("flow", 0)))
-                capacity = ic_info.get("capacity_mw", 1000)
+                capacity = ic_info["capacity_mw"]
                 
                 flows.append(InterconnectorFlow(
-                    interconnector_id=ic_id,
-                    name=ic_info.get("name", ic_id),
-                    country=ic_info.get("country", ""),
+                    interconnector_id=_intern(ic_id),
+                    name=ic_info["name"] or ic_id,
+                    country=ic_info["country"],
                     flow_mw=flow_mw,
                     capacity_mw=capacity,
                     timestamp=now,
@@ -1456,8 +2416,9 @@ class ElexonBMRSClient:
         try:
             return SystemFrequency(
                 frequency_hz=float(latest.get("frequency", 50.0)),
-                timestamp=datetime.fromisoformat(
-                    latest.get("measurementTime", datetime.now().isoformat())
+                timestamp=(
+                    _parse_iso(latest["measurementTime"])
+                    if latest.get("measurementTime") else datetime.now(timezone.utc)
                 ),
             )
         except (ValueError, TypeError):
@@ -1477,8 +2438,9 @@ class ElexonBMRSClient:
         try:
             return DemandData(
                 demand_mw=float(latest.get("initialDemandOutturn", 0)),
-                timestamp=datetime.fromisoformat(
-                    latest.get("startTime", datetime.now().isoformat())
+                timestamp=(
+                    _parse_iso(latest["startTime"])
+                    if latest.get("startTime") else datetime.now(timezone.utc)
                 ),
                 demand_type="national",
                 settlement_period=latest.get("settlementPeriod"),
@@ -1493,11 +2455,13 @@ class ElexonBMRSClient:
             return {}
         return data
     
+    @_ttl_cached(CACHE_TTL_STATIC)
     async def get_all_fuel_types(self) -> list[dict]:
         """Get reference data for all fuel types."""
         data = await self._request("/reference/fueltypes/all")
         return data if isinstance(data, list) else []
     
+    @_ttl_cached(CACHE_TTL_STATIC)
     async def get_all_interconnectors(self) -> list[dict]:
         """Get reference data for all interconnectors."""
         data = await self._request("/reference/interconnectors/all")
@@ -1520,59 +2484,104 @@ class ElexonBMRSClient:
             return []
         return data.get("data", [])
     
+    async def _fetch_grid_snapshot(self) -> tuple[Any, ...]:
+        """Fetch generation, interconnectors, demand and frequency together.
+        
+        The four endpoints are requested in parallel and the results are
+        reused for a few seconds, so the circuit-flow and summary views
+        built in the same refresh share one set of requests. Concurrent
+        callers wait on the lock instead of issuing duplicate fetches.
+        
+        Each getter parses its own response as soon as it arrives, so
+        decoding already overlaps the slower downloads; only the cheap
+        normalisation below waits for the last one.
+        
+        Returns:
+            Tuple of (generation, interconnectors, demand, frequency);
+            a failed fetch is normalised to an empty list or None
+        """
+        async with self._snapshot_lock:
+            cached = self._snapshot_cache
+            if cached is not None and time.monotonic() - cached[0] < self._SNAPSHOT_TTL:
+                return cached[1]
+            
+            generation, interconnectors, demand, frequency = await asyncio.gather(
+                self.get_generation_by_fuel_type(),
+                self.get_interconnector_flows(),
+                self.get_demand_outturn(),
+                self.get_system_frequency(),
+                return_exceptions=True,
+            )
+            # Normalise once so every consumer can unpack without type checks
+            results = (
+                generation if isinstance(generation, list) else [],
+                interconnectors if isinstance(interconnectors, list) else [],
+                demand if isinstance(demand, DemandData) else None,
+                frequency if isinstance(frequency, SystemFrequency) else None,
+            )
+            self._snapshot_cache = (time.monotonic(), results)
+            return results
+    
+    async def get_grid_snapshot(self) -> dict[str, Any]:
+        """Get the shared grid snapshot as individual datasets.
+        
+        Returns:
+            Dict with generation, interconnectors, demand and frequency;
+            failed fetches are empty lists or None
+        """
+        generation, interconnectors, demand, frequency = await self._fetch_grid_snapshot()
+        return {
+            "generation": generation,
+            "interconnectors": interconnectors,
+            "demand": demand,
+            "frequency": frequency,
+        }
+    
     async def get_circuit_flows(self) -> list[CircuitFlow]:
         """Get aggregated view of all metered circuits.
         
         Combines generation units, interconnectors, and demand into
         a unified view of power flows across the grid.
         """
-        # Fetch all data in parallel
-        results = await asyncio.gather(
-            self.get_generation_by_fuel_type(),
-            self.get_interconnector_flows(),
-            self.get_demand_outturn(),
-            return_exceptions=True,
-        )
+        generation, interconnectors, demand, _ = await self._fetch_grid_snapshot()
         
         flows = []
         now = datetime.now()
         
         # Add generation by fuel type
-        if isinstance(results[0], list):
-            for gen in results[0]:
-                flows.append(CircuitFlow(
-                    circuit_id=f"gen_{gen.fuel_type.lower()}",
-                    circuit_type="generation",
-                    name=f"{gen.fuel_type} Generation",
-                    flow_mw=gen.output_mw,
-                    capacity_mw=None,  # Could be calculated from reference data
-                    direction="in",
-                    fuel_type=gen.fuel_type,
-                    timestamp=now,
-                ))
+        for gen in generation:
+            flows.append(CircuitFlow(
+                circuit_id=f"gen_{gen.fuel_type.lower()}",
+                circuit_type="generation",
+                name=f"{gen.fuel_type} Generation",
+                flow_mw=gen.output_mw,
+                capacity_mw=None,  # Could be calculated from reference data
+                direction="in",
+                fuel_type=gen.fuel_type,
+                timestamp=now,
+            ))
         
         # Add interconnector flows
-        if isinstance(results[1], list):
-            for ic in results[1]:
-                direction = "in" if ic.flow_mw >= 0 else "out"
-                flows.append(CircuitFlow(
-                    circuit_id=f"ic_{ic.interconnector_id.lower()}",
-                    circuit_type="interconnector",
-                    name=ic.name,
-                    flow_mw=abs(ic.flow_mw),
-                    capacity_mw=float(ic.capacity_mw),
-                    direction=direction,
-                    fuel_type="interconnector",
-                    timestamp=now,
-                ))
+        for ic in interconnectors:
+            direction = "in" if ic.flow_mw >= 0 else "out"
+            flows.append(CircuitFlow(
+                circuit_id=f"ic_{ic.interconnector_id.lower()}",
+                circuit_type="interconnector",
+                name=ic.name,
+                flow_mw=abs(ic.flow_mw),
+                capacity_mw=float(ic.capacity_mw),
+                direction=direction,
+                fuel_type="interconnector",
+                timestamp=now,
+            ))
         
         # Add demand
-        if isinstance(results[2], DemandData):
+        if demand is not None:
             flows.append(CircuitFlow(
                 circuit_id="demand_national",
                 circuit_type="demand",
                 name="National Demand",
-                flow_mw=results[2].demand_mw,
+                flow_mw=demand.demand_mw,
                 capacity_mw=None,
                 direction="out",
                 fuel_type=None,
@@ -1591,39 +2600,23 @@ class ElexonBMRSClient:
         - System frequency
         - Net import/export position
         """
-        results = await asyncio.gather(
-            self.get_generation_by_fuel_type(),
-            self.get_interconnector_flows(),
-            self.get_demand_outturn(),
-            self.get_system_frequency(),
-            return_exceptions=True,
-        )
+        generation, interconnectors, demand, frequency = await self._fetch_grid_snapshot()
+        
+        # Running totals in locals rather than read-modify-write on the dict
+        total_import = sum(ic.flow_mw for ic in interconnectors if ic.flow_mw >= 0)
+        total_export = sum(-ic.flow_mw for ic in interconnectors if ic.flow_mw < 0)
         
         summary = {
             "timestamp": datetime.now().isoformat(),
-            "generation": {},
-            "interconnectors": {},
-            "demand_mw": None,
-            "frequency_hz": None,
-            "total_generation_mw": 0,
-            "total_import_mw": 0,
-            "total_export_mw": 0,
-            "net_import_mw": 0,
-        }
-        
-        # Process generation
-        if isinstance(results[0], list):
-            for gen in results[0]:
-                summary["generation"][gen.fuel_type] = {
+            "generation": {
+                gen.fuel_type: {
                     "output_mw": gen.output_mw,
                     "percentage": gen.percentage,
                 }
-                summary["total_generation_mw"] += gen.output_mw
-        
-        # Process interconnectors
-        if isinstance(results[1], list):
-            for ic in results[1]:
-                summary["interconnectors"][ic.interconnector_id] = {
+                for gen in generation
+            },
+            "interconnectors": {
+                ic.interconnector_id: {
                     "name": ic.name,
                     "country": ic.country,
                     "flow_mw": ic.flow_mw,
@@ -1631,20 +2624,15 @@ class ElexonBMRSClient:
                     "utilization_pct": ic.utilization_pct,
                     "direction": "import" if ic.flow_mw >= 0 else "export",
                 }
-                if ic.flow_mw >= 0:
-                    summary["total_import_mw"] += ic.flow_mw
-                else:
-                    summary["total_export_mw"] += abs(ic.flow_mw)
-        
-        summary["net_import_mw"] = summary["total_import_mw"] - summary["total_export_mw"]
-        
-        # Process demand
-        if isinstance(results[2], DemandData):
-            summary["demand_mw"] = results[2].demand_mw
-        
-        # Process frequency
-        if isinstance(results[3], SystemFrequency):
-            summary["frequency_hz"] = results[3].frequency_hz
+                for ic in interconnectors
+            },
+            "demand_mw": demand.demand_mw if demand is not None else None,
+            "frequency_hz": frequency.frequency_hz if frequency is not None else None,
+            "total_generation_mw": sum(gen.output_mw for gen in generation),
+            "total_import_mw": total_import,
+            "total_export_mw": total_export,
+            "net_import_mw": total_import - total_export,
+        }
         
         return summary
 
@@ -1675,7 +2663,10 @@ class ElectricityMapsClient:
         self.session = session
         self.api_key = api_key
         self.base_url = ELECTRICITY_MAPS_API_BASE
+        self._headers = {"auth-token": api_key}
+        self._cache_id = _credential_id(api_key)
     
+    @_single_flight
     async def _request(
         self, 
         endpoint: str, 
@@ -1683,14 +2674,24 @@ class ElectricityMapsClient:
     ) -> dict | None:
         """Make an authenticated request to the API."""
         url = f"{self.base_url}{endpoint}"
-        headers = {
-            "auth-token": self.api_key,
-        }
+        key = _RESPONSE_CACHE.key(url, params, self._cache_id)
+        if (cached := _RESPONSE_CACHE.get(key)) is not None:
+            return cached
+        
+        headers = self._headers
+        if conditional := _RESPONSE_CACHE.conditional_headers(key):
+            headers = {**headers, **conditional}
         
         try:
-            async with self.session.get(url, headers=headers, params=params) as response:
+            async with _get_with_retry(
+                self.session.get, url, headers=headers, params=params
+            ) as response:
+                if response.status == 304:
+                    return _RESPONSE_CACHE.revalidate(key, CACHE_TTL_FORECAST, response.headers)
                 if response.status == 200:
-                    return await response.json()
+                    data = await _json(response)
+                    _RESPONSE_CACHE.put(key, data, response.headers, CACHE_TTL_FORECAST)
+                    return data
                 elif response.status == 401:
                     _LOGGER.error("Electricity Maps API: Invalid API key")
                 elif response.status == 429:
@@ -1698,7 +2699,7 @@ class ElectricityMapsClient:
                 else:
                     _LOGGER.error("Electricity Maps API error: %s", response.status)
                 return None
-        except Exception as e:
+        except _REQUEST_ERRORS as e:
             _LOGGER.error("Electricity Maps API request failed: %s", e)
             return None
     
@@ -1716,18 +2717,14 @@ class ElectricityMapsClient:
             return None
         
         try:
-            zone_info = ELECTRICITY_MAPS_ZONES.get(zone, {"name": zone, "country": ""})
-            
             return ZoneCarbonIntensity(
                 zone=zone,
-                zone_name=zone_info.get("name", zone),
+                zone_name=_display_name(ELECTRICITY_MAPS_ZONES, zone),
                 carbon_intensity=data.get("carbonIntensity", 0),
                 carbon_intensity_unit="gCO2eq/kWh",
                 fossil_free_percentage=data.get("fossilFreePercentage"),
                 renewable_percentage=data.get("renewablePercentage"),
-                timestamp=datetime.fromisoformat(
-                    data.get("datetime", "").replace("Z", "+00:00")
-                ),
+                timestamp=_parse_iso(data.get("datetime", "")),
                 data_source="Electricity Maps",
             )
         except Exception as e:
@@ -1748,8 +2745,6 @@ class ElectricityMapsClient:
             return None
         
         try:
-            zone_info = ELECTRICITY_MAPS_ZONES.get(zone, {"name": zone, "country": ""})
-            
             # Extract power production by source
             production = data.get("powerProductionBreakdown", {})
             generation_by_source = {}
@@ -1759,15 +2754,13 @@ class ElectricityMapsClient:
             
             return ZonePowerBreakdown(
                 zone=zone,
-                zone_name=zone_info.get("name", zone),
+                zone_name=_display_name(ELECTRICITY_MAPS_ZONES, zone),
                 power_consumption_mw=data.get("powerConsumptionTotal"),
                 power_production_mw=data.get("powerProductionTotal"),
                 power_import_mw=data.get("powerImportTotal"),
                 power_export_mw=data.get("powerExportTotal"),
                 generation_by_source=generation_by_source,
-                timestamp=datetime.fromisoformat(
-                    data.get("datetime", "").replace("Z", "+00:00")
-                ),
+                timestamp=_parse_iso(data.get("datetime", "")),
                 data_source="Electricity Maps",
             )
         except Exception as e:
@@ -1792,22 +2785,25 @@ class ElectricityMapsClient:
         if not data or "history" not in data:
             return []
         
-        results = []
-        zone_info = ELECTRICITY_MAPS_ZONES.get(zone, {"name": zone, "country": ""})
+        results: list[ZoneCarbonIntensity] = []
+        zone_name = _display_name(ELECTRICITY_MAPS_ZONES, zone)
+        # Hoisted out of the per-row loop; fields are passed positionally
+        append = results.append
+        parse = _parse_iso
+        record = ZoneCarbonIntensity
         
-        for entry in data.get("history", [])[:hours]:
+        for entry in islice(data.get("history", []), hours):
+            get = entry.get
             try:
-                results.append(ZoneCarbonIntensity(
-                    zone=zone,
-                    zone_name=zone_info.get("name", zone),
-                    carbon_intensity=entry.get("carbonIntensity", 0),
-                    carbon_intensity_unit="gCO2eq/kWh",
-                    fossil_free_percentage=entry.get("fossilFreePercentage"),
-                    renewable_percentage=entry.get("renewablePercentage"),
-                    timestamp=datetime.fromisoformat(
-                        entry.get("datetime", "").replace("Z", "+00:00")
-                    ),
-                    data_source="Electricity Maps",
+                append(record(
+                    zone,
+                    zone_name,
+                    get("carbonIntensity", 0),
+                    "gCO2eq/kWh",
+                    get("fossilFreePercentage"),
+                    get("renewablePercentage"),
+                    parse(get("datetime", "")),
+                    "Electricity Maps",
                 ))
             except Exception:
                 continue
@@ -1835,6 +2831,9 @@ class EIAClient:
     Provides: US electricity generation, consumption, prices, fuel mix
     """
     
+    # Upper bound on fuel types EIA reports for one respondent-hour
+    _FUEL_ROWS_PER_HOUR = 20
+    
     def __init__(
         self, 
         session: aiohttp.ClientSession, 
@@ -1850,6 +2849,7 @@ class EIAClient:
         self.api_key = api_key
         self.base_url = EIA_API_BASE
     
+    @_single_flight
     async def _request(
         self, 
         route: str, 
@@ -1861,16 +2861,29 @@ class EIAClient:
         if params:
             request_params.update(params)
         
+        key = _RESPONSE_CACHE.key(url, request_params)
+        if (cached := _RESPONSE_CACHE.get(key)) is not None:
+            return cached
+        
         try:
-            async with self.session.get(url, params=request_params) as response:
+            async with _get_with_retry(
+                self.session.get,
+                url,
+                params=request_params,
+                headers=_RESPONSE_CACHE.conditional_headers(key),
+            ) as response:
+                if response.status == 304:
+                    return _RESPONSE_CACHE.revalidate(key, CACHE_TTL_FORECAST, response.headers)
                 if response.status == 200:
-                    return await response.json()
+                    data = await _json(response)
+                    _RESPONSE_CACHE.put(key, data, response.headers, CACHE_TTL_FORECAST)
+                    return data
                 elif response.status == 401:
                     _LOGGER.error("EIA API: Invalid API key")
                 else:
                     _LOGGER.error("EIA API error: %s", response.status)
                 return None
-        except Exception as e:
+        except _REQUEST_ERRORS as e:
             _LOGGER.error("EIA API request failed: %s", e)
             return None
     
@@ -1886,18 +2899,18 @@ class EIAClient:
         Returns:
             ZonePowerBreakdown with generation data
         """
-        # Use the electricity/rto route for real-time data
+        # Use the electricity/rto route for real-time data. Filtering on the
+        # respondent (US48 is one too) and sorting newest first means the
+        # latest hour's fuel rows come first, so only that hour is fetched
         params = {
             "frequency": "hourly",
             "data[]": "value",
+            "facets[respondent][]": region,
             "sort[0][column]": "period",
             "sort[0][direction]": "desc",
-            "length": "24",
+            "length": str(self._FUEL_ROWS_PER_HOUR),
         }
         
-        if region != "US48":
-            params["facets[respondent][]"] = region
-        
         data = await self._request("electricity/rto/fuel-type-data/data", params)
         if not data or "response" not in data:
             return None
@@ -1907,30 +2920,23 @@ class EIAClient:
             if not rows:
                 return None
             
-            # Aggregate by fuel type (latest hour)
-            generation_by_source = {}
-            latest_period = rows[0].get("period") if rows else None
-            total_gen = 0
-            
-            for row in rows:
-                if row.get("period") != latest_period:
-                    break
-                fuel = row.get("fueltype", "unknown")
-                value = float(row.get("value", 0))
-                generation_by_source[fuel] = value
-                total_gen += value
-            
-            region_info = EIA_REGIONS.get(region, {"name": region, "type": "region"})
+            # Aggregate by fuel type (latest hour; rows are newest first)
+            latest_period = rows[0].get("period")
+            generation_by_source = {
+                row.get("fueltype", "unknown"): float(row.get("value", 0))
+                for row in takewhile(lambda row: row.get("period") == latest_period, rows)
+            }
+            total_gen = sum(generation_by_source.values())
             
             return ZonePowerBreakdown(
                 zone=region,
-                zone_name=region_info.get("name", region),
+                zone_name=_display_name(EIA_REGIONS, region),
                 power_consumption_mw=None,  # Separate endpoint
                 power_production_mw=total_gen,
                 power_import_mw=None,
                 power_export_mw=None,
                 generation_by_source=generation_by_source,
-                timestamp=datetime.fromisoformat(latest_period) if latest_period else datetime.now(),
+                timestamp=_parse_iso(latest_period) if latest_period else datetime.now(),
                 data_source="EIA",
             )
         except Exception as e:
@@ -1952,11 +2958,9 @@ class EIAClient:
             "sort[0][column]": "period",
             "sort[0][direction]": "desc",
             "length": "1",
+            "facets[respondent][]": region,
         }
         
-        if region != "US48":
-            params["facets[respondent][]"] = region
-        
         data = await self._request("electricity/rto/demand/data", params)
         if not data or "response" not in data:
             return None
@@ -1971,6 +2975,89 @@ class EIAClient:
             return None
 
 
+class _TimeSeriesTarget:
+    """Parser target collecting ENTSO-E TimeSeries points.
+    
+    Receives SAX-style callbacks from ``XMLParser`` and keeps text only for
+    the series identifiers and point values; everything else is dropped at
+    the callback level. Points are collected as plain
+    ``(mrid, psr_type, position, quantity)`` tuples.
+    """
+    
+    _NS = "{urn:iec62325.351:tc57wg16:451-6:generationloaddocument:3:0}"
+    _SERIES = f"{_NS}TimeSeries"
+    _POINT = f"{_NS}Point"
+    _MRID = f"{_NS}mRID"
+    _PSR_TYPE = f"{_NS}psrType"
+    _POSITION = f"{_NS}position"
+    _QUANTITY = f"{_NS}quantity"
+    _CAPTURE = frozenset((_MRID, _PSR_TYPE, _POSITION, _QUANTITY))
+    
+    def __init__(self) -> None:
+        """Initialize the target."""
+        self.points: list[tuple[str | None, str | None, int, float]] = []
+        self._in_series = False
+        self._mrid: str | None = None
+        self._psr_type: str | None = None
+        self._position: str | None = None
+        self._quantity: str | None = None
+        self._text: list[str] | None = None
+    
+    def start(self, tag: str, attrib: Mapping[str, str]) -> None:
+        """Handle an opening tag."""
+        if tag == self._SERIES:
+            self._in_series = True
+            self._mrid = self._psr_type = None
+        elif tag == self._POINT:
+            self._position = self._quantity = None
+        elif self._in_series and tag in self._CAPTURE:
+            self._text = []
+    
+    def data(self, text: str) -> None:
+        """Collect text, but only inside a captured tag."""
+        if self._text is not None:
+            self._text.append(text)
+    
+    def end(self, tag: str) -> None:
+        """Handle a closing tag."""
+        if self._text is not None:
+            value = "".join(self._text).strip()
+            self._text = None
+            if tag == self._QUANTITY:
+                self._quantity = value
+            elif tag == self._POSITION:
+                self._position = value
+            elif tag == self._PSR_TYPE:
+                self._psr_type = value
+            elif tag == self._MRID and self._mrid is None:
+                self._mrid = value
+        elif tag == self._POINT:
+            if self._quantity:
+                self.points.append((
+                    self._mrid,
+                    self._psr_type,
+                    int(self._position) if self._position else 0,
+                    float(self._quantity),
+                ))
+        elif tag == self._SERIES:
+            self._in_series = False
+    
+    def close(self) -> list[tuple[str | None, str | None, int, float]]:
+        """Return the collected points once parsing finishes."""
+        return self.points
+
+
+# Map ENTSO-E PSR types to fuel names
+_ENTSOE_PSR_TYPES: Mapping[str, str] = MappingProxyType({
+    "B01": "biomass", "B02": "brown_coal", "B03": "coal_gas",
+    "B04": "gas", "B05": "coal", "B06": "oil",
+    "B09": "geothermal", "B10": "hydro_pumped", "B11": "hydro",
+    "B12": "hydro_reservoir", "B13": "marine", "B14": "nuclear",
+    "B15": "other_renewable", "B16": "solar", "B17": "waste",
+    "B18": "wind_offshore", "B19": "wind_onshore", "B20": "other",
+})
+
+
 class ENTSOEClient:
     """Client for ENTSO-E Transparency Platform API.
     
@@ -1979,6 +3066,9 @@ class ENTSOEClient:
     Provides: European grid data - generation, load, cross-border flows
     """
     
+    # A75/A65 queries regularly take longer than the session default
+    _TIMEOUT = aiohttp.ClientTimeout(total=60)
+    
     def __init__(
         self, 
         session: aiohttp.ClientSession, 
@@ -1994,50 +3084,55 @@ class ENTSOEClient:
         self.security_token = security_token
         self.base_url = ENTSOE_API_BASE
     
-    async def _request(self, params: dict[str, Any]) -> str | None:
-        """Make a request to the ENTSO-E API (returns XML)."""
+    @_single_flight
+    async def _request_bytes(self, params: dict[str, Any]) -> bytes | None:
+        """Make a request to the ENTSO-E API (returns raw XML bytes)."""
         params["securityToken"] = self.security_token
         
+        key = _RESPONSE_CACHE.key(self.base_url, params)
+        if (cached := _RESPONSE_CACHE.get(key)) is not None:
+            return cached
+        
         try:
-            async with self.session.get(self.base_url, params=params) as response:
+            async with _get_with_retry(
+                self.session.get,
+                self.base_url,
+                params=params,
+                headers=_RESPONSE_CACHE.conditional_headers(key),
+                timeout=self._TIMEOUT,
+            ) as response:
+                if response.status == 304:
+                    return _RESPONSE_CACHE.revalidate(key, CACHE_TTL_FORECAST, response.headers)
                 if response.status == 200:
-                    return await response.text()
+                    data = await response.read()
+                    _RESPONSE_CACHE.put(key, data, response.headers, CACHE_TTL_FORECAST)
+                    return data
                 elif response.status == 401:
                     _LOGGER.error("ENTSO-E API: Invalid security token")
                 else:
                     _LOGGER.error("ENTSO-E API error: %s", response.status)
                 return None
-        except Exception as e:
+        except _REQUEST_ERRORS as e:
             _LOGGER.error("ENTSO-E API request failed: %s", e)
             return None
     
-    def _parse_xml_timeseries(self, xml_text: str) -> list[dict[str, Any]]:
-        """Parse ENTSO-E XML response for time series data."""
-        results = []
-        try:
-            ns = {"ns": "urn:iec62325.351:tc57wg16:451-6:generationloaddocument:3:0"}
-            root = ElementTree.fromstring(xml_text)
-            
-            for ts in root.findall(".//ns:TimeSeries", ns):
-                mrid = ts.find("ns:mRID", ns)
-                psr_type = ts.find(".//ns:psrType", ns)
-                
-                for period in ts.findall(".//ns:Period", ns):
-                    for point in period.findall(".//ns:Point", ns):
-                        position = point.find("ns:position", ns)
-                        quantity = point.find("ns:quantity", ns)
-                        
-                        if quantity is not None:
-                            results.append({
-                                "mrid": mrid.text if mrid is not None else None,
-                                "psr_type": psr_type.text if psr_type is not None else None,
-                                "position": int(position.text) if position is not None else 0,
-                                "quantity": float(quantity.text),
-                            })
-        except Exception as e:
-            _LOGGER.error("Error parsing ENTSO-E XML: %s", e)
+    def _parse_timeseries_points(
+        self,
+        xml_bytes: bytes,
+    ) -> list[tuple[str | None, str | None, int, float]]:
+        """Extract time series points from an ENTSO-E XML document.
         
-        return results
+        The raw response bytes are fed straight to the parser, which reads
+        the encoding from the XML declaration. Driven through a parser
+        target so no element tree is ever built; only the handful of tags
+        we read have their text collected.
+        
+        Returns:
+            List of (mrid, psr_type, position, quantity) tuples
+        """
+        parser = ET.XMLParser(target=_TimeSeriesTarget(), **_XML_PARSER_OPTIONS)
+        parser.feed(xml_bytes)
+        return parser.close()
     
     async def get_generation_per_type(
         self, 
@@ -2065,40 +3160,32 @@ class ENTSOEClient:
             "periodEnd": end,
         }
         
-        xml_data = await self._request(params)
-        if not xml_data:
+        xml_bytes = await self._request_bytes(params)
+        if not xml_bytes:
             return None
         
         try:
-            results = self._parse_xml_timeseries(xml_data)
-            
-            # Map ENTSO-E PSR types to fuel names
-            psr_type_map = {
-                "B01": "biomass", "B02": "brown_coal", "B03": "coal_gas",
-                "B04": "gas", "B05": "coal", "B06": "oil",
-                "B09": "geothermal", "B10": "hydro_pumped", "B11": "hydro",
-                "B12": "hydro_reservoir", "B13": "marine", "B14": "nuclear",
-                "B15": "other_renewable", "B16": "solar", "B17": "waste",
-                "B18": "wind_offshore", "B19": "wind_onshore", "B20": "other",
+            points = self._parse_timeseries_points(xml_bytes)
+            # Number each PSR type as first seen, then sum per type in C
+            psr_ids: dict[str | None, int] = {}
+            ids = np.fromiter(
+                (psr_ids.setdefault(psr, len(psr_ids)) for _, psr, _, _ in points),
+                dtype=np.intp,
+                count=len(points),
+            )
+            quantities = np.fromiter(
+                (val for _, _, _, val in points), dtype=np.float64, count=len(points)
+            )
+            sums = np.bincount(ids, weights=quantities, minlength=len(psr_ids))
+            fuel_for = _ENTSOE_PSR_TYPES.get
+            generation_by_source = {
+                fuel_for(psr, psr): float(sums[i]) for psr, i in psr_ids.items()
             }
-            
-            generation_by_source = {}
-            total = 0
-            for entry in results:
-                psr = entry.get("psr_type", "")
-                fuel = psr_type_map.get(psr, psr)
-                val = entry.get("quantity", 0)
-                if fuel in generation_by_source:
-                    generation_by_source[fuel] += val
-                else:
-                    generation_by_source[fuel] = val
-                total += val
-            
-            area_info = ENTSOE_AREAS.get(area_code, {"name": area_code, "country": ""})
+            total = float(quantities.sum())
             
             return ZonePowerBreakdown(
                 zone=area_code,
-                zone_name=area_info.get("name", area_code),
+                zone_name=_display_name(ENTSOE_AREAS, area_code),
                 power_consumption_mw=None,
                 power_production_mw=total,
                 power_import_mw=None,
@@ -2137,16 +3224,14 @@ class ENTSOEClient:
             "periodEnd": end,
         }
         
-        xml_data = await self._request(params)
-        if not xml_data:
+        xml_bytes = await self._request_bytes(params)
+        if not xml_bytes:
             return None
         
         try:
-            results = self._parse_xml_timeseries(xml_data)
-            if results:
-                # Return the latest value
-                return results[-1].get("quantity")
-            return None
+            # Return the latest value
+            points = self._parse_timeseries_points(xml_bytes)
+            return points[-1][3] if points else None
         except Exception as e:
             _LOGGER.error("Error parsing ENTSO-E load: %s", e)
             return None
@@ -2165,22 +3250,35 @@ class OpenElectricityClient:
         self.session = session
         self.base_url = OPENELECTRICITY_API_BASE
     
+    @_single_flight
     async def _request(
         self, 
         endpoint: str, 
         params: dict[str, Any] | None = None,
     ) -> dict | None:
-        """Make a request to the OpenElectricity API."""
+        """Make a request to the OpenElectricity API (5-minute data, cached)."""
         url = f"{self.base_url}{endpoint}"
+        key = _RESPONSE_CACHE.key(url, params)
+        if (cached := _RESPONSE_CACHE.get(key)) is not None:
+            return cached
         
         try:
-            async with self.session.get(url, params=params) as response:
+            async with _get_with_retry(
+                self.session.get,
+                url,
+                params=params,
+                headers=_RESPONSE_CACHE.conditional_headers(key),
+            ) as response:
+                if response.status == 304:
+                    return _RESPONSE_CACHE.revalidate(key, CACHE_TTL_FORECAST, response.headers)
                 if response.status == 200:
-                    return await response.json()
+                    data = await _json(response)
+                    _RESPONSE_CACHE.put(key, data, response.headers, CACHE_TTL_FORECAST)
+                    return data
                 else:
                     _LOGGER.error("OpenElectricity API error: %s", response.status)
                 return None
-        except Exception as e:
+        except _REQUEST_ERRORS as e:
             _LOGGER.error("OpenElectricity API request failed: %s", e)
             return None
     
@@ -2215,19 +3313,16 @@ class OpenElectricityClient:
                     generation_by_source[fuel] = output
             
             zone_name = region if region else network
-            region_info = AUSTRALIA_REGIONS.get(zone_name, {"name": zone_name, "network": network})
             
             return ZonePowerBreakdown(
                 zone=zone_name,
-                zone_name=region_info.get("name", zone_name),
+                zone_name=_display_name(AUSTRALIA_REGIONS, zone_name),
                 power_consumption_mw=data.get("demand"),
                 power_production_mw=data.get("generation"),
                 power_import_mw=data.get("imports"),
                 power_export_mw=data.get("exports"),
                 generation_by_source=generation_by_source,
-                timestamp=datetime.fromisoformat(
-                    data.get("data_updated", "").replace("Z", "+00:00")
-                ) if data.get("data_updated") else datetime.now(),
+                timestamp=_parse_iso(data.get("data_updated", "")) if data.get("data_updated") else datetime.now(),
                 data_source="OpenElectricity",
             )
         except Exception as e:
@@ -2258,9 +3353,7 @@ class OpenElectricityClient:
                 carbon_intensity_unit="kgCO2e/MWh",
                 fossil_free_percentage=None,
                 renewable_percentage=data.get("renewables_proportion", 0) * 100,
-                timestamp=datetime.fromisoformat(
-                    data.get("data_updated", "").replace("Z", "+00:00")
-                ) if data.get("data_updated") else datetime.now(),
+                timestamp=_parse_iso(data.get("data_updated", "")) if data.get("data_updated") else datetime.now(),
                 data_source="OpenElectricity",
             )
         except Exception as e:
@@ -2280,26 +3373,39 @@ class REEEsiosClient:
         """Initialize the REE Esios client."""
         self.session = session
         self.base_url = REE_ESIOS_API_BASE
+        self._headers = {
+            "Accept": "application/json; application/vnd.esios-api-v1+json",
+        }
     
+    @_single_flight
     async def _request(
         self, 
         endpoint: str, 
         params: dict[str, Any] | None = None,
     ) -> dict | None:
-        """Make a request to the REE Esios API."""
+        """Make a request to the REE Esios API (cached)."""
         url = f"{self.base_url}{endpoint}"
-        headers = {
-            "Accept": "application/json; application/vnd.esios-api-v1+json",
-        }
+        key = _RESPONSE_CACHE.key(url, params)
+        if (cached := _RESPONSE_CACHE.get(key)) is not None:
+            return cached
         
         try:
-            async with self.session.get(url, headers=headers, params=params) as response:
+            async with _get_with_retry(
+                self.session.get,
+                url,
+                headers={**self._headers, **_RESPONSE_CACHE.conditional_headers(key)},
+                params=params,
+            ) as response:
+                if response.status == 304:
+                    return _RESPONSE_CACHE.revalidate(key, CACHE_TTL_FORECAST, response.headers)
                 if response.status == 200:
-                    return await response.json()
+                    data = await _json(response)
+                    _RESPONSE_CACHE.put(key, data, response.headers, CACHE_TTL_FORECAST)
+                    return data
                 else:
                     _LOGGER.error("REE Esios API error: %s", response.status)
                 return None
-        except Exception as e:
+        except _REQUEST_ERRORS as e:
             _LOGGER.error("REE Esios API request failed: %s", e)
             return None
     
@@ -2332,9 +3438,7 @@ class REEEsiosClient:
                 power_import_mw=None,
                 power_export_mw=None,
                 generation_by_source={},  # Need to query indicator 10195
-                timestamp=datetime.fromisoformat(
-                    latest.get("datetime", "").replace("Z", "+00:00")
-                ) if latest.get("datetime") else datetime.now(),
+                timestamp=_parse_iso(latest.get("datetime", "")) if latest.get("datetime") else datetime.now(),
                 data_source="REE Esios",
             )
         except Exception as e:
@@ -2388,62 +3492,98 @@ class RTEClient:
         self.client_secret = client_secret
         self.base_url = RTE_API_BASE
         self._access_token: str | None = None
-        self._token_expires: datetime | None = None
-    
-    async def _get_token(self) -> str | None:
-        """Get or refresh OAuth2 access token."""
-        if self._access_token and self._token_expires and datetime.now() < self._token_expires:
-            return self._access_token
+        # Monotonic deadline, immune to wall-clock adjustments
+        self._token_expires = 0.0
+        self._token_lock = asyncio.Lock()
+        self._auth_headers: dict[str, str] = {}
+        self._cache_id = _credential_id(client_id, client_secret)
         
-        auth_url = f"{self.base_url}/token/oauth/"
+        # Client credentials never change, so encode them once
         credentials = base64.b64encode(
-            f"{self.client_id}:{self.client_secret}".encode()
+            f"{client_id}:{client_secret}".encode()
         ).decode()
-        
-        headers = {
+        self._token_headers = {
             "Authorization": f"Basic {credentials}",
             "Content-Type": "application/x-www-form-urlencoded",
         }
+    
+    def _valid_token(self) -> str | None:
+        """Return the current access token if it has not expired."""
+        if self._access_token and time.monotonic() < self._token_expires:
+            return self._access_token
+        return None
+    
+    async def _get_token(self) -> str | None:
+        """Get or refresh OAuth2 access token.
         
-        try:
-            async with self.session.post(auth_url, headers=headers) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    self._access_token = data.get("access_token")
-                    expires_in = data.get("expires_in", 3600)
-                    self._token_expires = datetime.now() + timedelta(seconds=expires_in - 60)
-                    return self._access_token
-                else:
-                    _LOGGER.error("RTE OAuth error: %s", response.status)
-                    return None
-        except Exception as e:
-            _LOGGER.error("RTE OAuth request failed: %s", e)
-            return None
+        Refreshes are single-flight: concurrent requests that find the
+        token expired wait on the lock and reuse the one new token rather
+        than each posting to the OAuth endpoint.
+        """
+        if (token := self._valid_token()) is not None:
+            return token
+        
+        async with self._token_lock:
+            # Another request may have refreshed it while we waited
+            if (token := self._valid_token()) is not None:
+                return token
+            
+            auth_url = f"{self.base_url}/token/oauth/"
+            
+            try:
+                async with self.session.post(auth_url, headers=self._token_headers) as response:
+                    if response.status == 200:
+                        data = await _json(response)
+                        self._access_token = data.get("access_token")
+                        self._auth_headers = {"Authorization": f"Bearer {self._access_token}"}
+                        expires_in = data.get("expires_in", 3600)
+                        self._token_expires = time.monotonic() + expires_in - 60
+                        return self._access_token
+                    else:
+                        _LOGGER.error("RTE OAuth error: %s", response.status)
+                        return None
+            except _REQUEST_ERRORS as e:
+                _LOGGER.error("RTE OAuth request failed: %s", e)
+                return None
     
+    @_single_flight
     async def _request(
         self, 
         api_name: str,
         endpoint: str, 
         params: dict[str, Any] | None = None,
     ) -> dict | None:
-        """Make an authenticated request to the RTE API."""
+        """Make an authenticated request to the RTE API (cached).
+        
+        A cache hit skips the OAuth token check as well as the request,
+        which matters for RTE's tight per-application quotas.
+        """
+        url = f"{self.base_url}/open_api/{api_name}/{endpoint}"
+        key = _RESPONSE_CACHE.key(url, params, self._cache_id)
+        if (cached := _RESPONSE_CACHE.get(key)) is not None:
+            return cached
+        
         token = await self._get_token()
         if not token:
             return None
         
-        url = f"{self.base_url}/open_api/{api_name}/{endpoint}"
-        headers = {
-            "Authorization": f"Bearer {token}",
-        }
-        
         try:
-            async with self.session.get(url, headers=headers, params=params) as response:
+            async with _get_with_retry(
+                self.session.get,
+                url,
+                headers={**self._auth_headers, **_RESPONSE_CACHE.conditional_headers(key)},
+                params=params,
+            ) as response:
+                if response.status == 304:
+                    return _RESPONSE_CACHE.revalidate(key, CACHE_TTL_FORECAST, response.headers)
                 if response.status == 200:
-                    return await response.json()
+                    data = await _json(response)
+                    _RESPONSE_CACHE.put(key, data, response.headers, CACHE_TTL_FORECAST)
+                    return data
                 else:
                     _LOGGER.error("RTE API error: %s", response.status)
                 return None
-        except Exception as e:
+        except _REQUEST_ERRORS as e:
             _LOGGER.error("RTE API request failed: %s", e)
             return None
     
@@ -2509,7 +3649,7 @@ class RTEClient:
 # ============================================================================
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class GridFrequency:
     """Grid frequency data."""
     
@@ -2521,7 +3661,7 @@ class GridFrequency:
     data_source: str = ""
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DayAheadPrice:
     """Day-ahead electricity price data."""
     
@@ -2533,7 +3673,7 @@ class DayAheadPrice:
     data_source: str = ""
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ImbalanceData:
     """Grid imbalance data."""
     
@@ -2550,6 +3690,10 @@ class ImbalanceData:
 # ============================================================================
 
 
+# Production, consumption, wind, solar, nuclear, hydro
+_FINGRID_BREAKDOWN_IDS = (74, 124, 75, 248, 188, 191)
+
+
 class FingridClient:
     """Client for Fingrid Open Data API (Finland).
     
@@ -2563,82 +3707,85 @@ class FingridClient:
         """Initialize the client.
         
         Args:
-            session: aiohttp client session
+            session: Shared HAGridHTTP session (pooled keep-alive connections)
             api_key: Fingrid API key (free registration)
         """
         self._session = session
         self._api_key = api_key
         self._base_url = "https://api.fingrid.fi/v1"
+        self._headers = {"x-api-key": api_key}
     
-    async def _request(self, dataset_id: int, start_time: str | None = None) -> list[dict] | None:
-        """Make API request to Fingrid.
+    async def _request_many(self, dataset_ids: list[int]) -> dict[int, dict]:
+        """Get the latest event of several datasets in one request.
         
         Args:
-            dataset_id: Fingrid dataset ID
-            start_time: Optional start time (ISO format)
+            dataset_ids: Fingrid dataset IDs
+        
+        Returns:
+            Dict of dataset ID -> latest event (missing IDs are absent)
         """
-        url = f"{self._base_url}/variable/{dataset_id}/events/json"
-        headers = {"x-api-key": self._api_key}
-        params = {}
-        if start_time:
-            params["start_time"] = start_time
+        url = f"{self._base_url}/variable/event/json/{','.join(map(str, dataset_ids))}"
         
         try:
-            async with self._session.get(url, headers=headers, params=params) as resp:
-                if resp.status == 200:
-                    return await resp.json()
-                _LOGGER.warning("Fingrid API returned %d for dataset %d", resp.status, dataset_id)
-                return None
-        except Exception as e:
+            async with _get_with_retry(self._session.get, url, headers=self._headers) as resp:
+                if resp.status != 200:
+                    _LOGGER.warning("Fingrid API returned %d for datasets %s", resp.status, dataset_ids)
+                    return {}
+                events = await _json(resp)
+        except _REQUEST_ERRORS as e:
             _LOGGER.error("Fingrid API error: %s", e)
-            return None
+            return {}
+        
+        if not isinstance(events, list):
+            _LOGGER.warning("Unexpected Fingrid response for datasets %s: %.200r", dataset_ids, events)
+            return {}
+        return {
+            event["variable_id"]: event
+            for event in events
+            if isinstance(event, dict) and "variable_id" in event
+        }
     
+    async def _latest_value(self, dataset_id: int) -> float | None:
+        """Get the latest value of one dataset."""
+        event = (await self._request_many([dataset_id])).get(dataset_id)
+        return event.get("value") if event else None
+    
+    @_ttl_cached(CACHE_TTL_SETTLEMENT)
     async def get_electricity_production(self) -> float | None:
         """Get total electricity production in Finland (MW)."""
-        data = await self._request(74)  # Dataset ID for electricity production
-        if data and len(data) > 0:
-            return data[-1].get("value")
-        return None
+        return await self._latest_value(74)
     
+    @_ttl_cached(CACHE_TTL_SETTLEMENT)
     async def get_electricity_consumption(self) -> float | None:
         """Get total electricity consumption in Finland (MW)."""
-        data = await self._request(124)
-        if data and len(data) > 0:
-            return data[-1].get("value")
-        return None
+        return await self._latest_value(124)
     
+    @_ttl_cached(CACHE_TTL_SETTLEMENT)
     async def get_wind_power(self) -> float | None:
         """Get wind power production in Finland (MW)."""
-        data = await self._request(75)
-        if data and len(data) > 0:
-            return data[-1].get("value")
-        return None
+        return await self._latest_value(75)
     
+    @_ttl_cached(CACHE_TTL_SETTLEMENT)
     async def get_solar_power(self) -> float | None:
         """Get solar power production in Finland (MW)."""
-        data = await self._request(248)
-        if data and len(data) > 0:
-            return data[-1].get("value")
-        return None
+        return await self._latest_value(248)
     
+    @_ttl_cached(CACHE_TTL_SETTLEMENT)
     async def get_nuclear_power(self) -> float | None:
         """Get nuclear power production in Finland (MW)."""
-        data = await self._request(188)
-        if data and len(data) > 0:
-            return data[-1].get("value")
-        return None
+        return await self._latest_value(188)
     
+    @_ttl_cached(CACHE_TTL_SETTLEMENT)
     async def get_frequency(self) -> GridFrequency | None:
         """Get current grid frequency in Finland."""
-        data = await self._request(177)
-        if data and len(data) > 0:
-            latest = data[-1]
+        latest = (await self._request_many([177])).get(177)
+        if latest:
             freq = latest.get("value", 50.0)
             deviation = freq - 50.0
             status = "normal" if abs(deviation) < 0.1 else ("high" if deviation > 0 else "low")
             return GridFrequency(
                 frequency_hz=freq,
-                timestamp=datetime.fromisoformat(latest.get("start_time", "").replace("Z", "+00:00")),
+                timestamp=_parse_iso(latest.get("start_time", "")),
                 target_hz=50.0,
                 deviation_hz=deviation,
                 status=status,
@@ -2646,27 +3793,16 @@ class FingridClient:
             )
         return None
     
+    @_ttl_cached(CACHE_TTL_SETTLEMENT)
     async def get_power_breakdown(self) -> ZonePowerBreakdown | None:
         """Get comprehensive power breakdown for Finland."""
-        # Fetch all data in parallel
-        results = await asyncio.gather(
-            self.get_electricity_production(),
-            self.get_electricity_consumption(),
-            self.get_wind_power(),
-            self.get_solar_power(),
-            self.get_nuclear_power(),
-            self._request(191),  # Hydro
-            return_exceptions=True,
+        # Latest event of every dataset in a single request
+        events = await self._request_many(list(_FINGRID_BREAKDOWN_IDS))
+        production, consumption, wind, solar, nuclear, hydro = (
+            events[dataset_id].get("value") if dataset_id in events else None
+            for dataset_id in _FINGRID_BREAKDOWN_IDS
         )
         
-        production = results[0] if not isinstance(results[0], Exception) else None
-        consumption = results[1] if not isinstance(results[1], Exception) else None
-        wind = results[2] if not isinstance(results[2], Exception) else None
-        solar = results[3] if not isinstance(results[3], Exception) else None
-        nuclear = results[4] if not isinstance(results[4], Exception) else None
-        hydro_data = results[5] if not isinstance(results[5], Exception) else None
-        hydro = hydro_data[-1].get("value") if hydro_data and len(hydro_data) > 0 else None
-        
         generation_by_source = {}
         if wind:
             generation_by_source["wind"] = wind
@@ -2690,11 +3826,22 @@ class FingridClient:
             power_export_mw=None,
             generation_by_source=generation_by_source,
             renewable_percentage=renewable_pct,
-            timestamp=datetime.now(timezone.utc),
+            timestamp=_now_utc(),
             data_source="Fingrid",
         )
 
 
+_ENERGINET_PRICE_AREAS = ("DK1", "DK2")
+# Production columns -> generation_by_source keys
+_ENERGINET_POWER_COLUMNS: Mapping[str, str] = MappingProxyType({
+    "OnshoreWindPower": "onshorewind",
+    "OffshoreWindPower": "offshorewind",
+    "SolarPower": "solar",
+    "ThermalPower": "thermal",
+    "HydroPower": "hydro",
+})
+
+
 class EnerginetClient:
     """Client for Energi Data Service API (Denmark).
     
@@ -2705,31 +3852,61 @@ class EnerginetClient:
     """
     
     def __init__(self, session: aiohttp.ClientSession):
-        """Initialize the client."""
+        """Initialize the client.
+        
+        Args:
+            session: Shared HAGridHTTP session (pooled keep-alive connections)
+        """
         self._session = session
         self._base_url = "https://api.energidataservice.dk"
     
-    async def _request(self, dataset: str, limit: int = 1, sort: str = "HourUTC DESC") -> dict | None:
-        """Make API request to Energinet."""
+    async def _request(
+        self,
+        dataset: str,
+        limit: int = 1,
+        sort: str = "HourUTC DESC",
+        filter_json: dict[str, list[str]] | None = None,
+        columns: list[str] | None = None,
+    ) -> dict | None:
+        """Make API request to Energinet.
+        
+        Args:
+            dataset: Dataset name
+            limit: Maximum records to return
+            sort: Sort expression
+            filter_json: Server-side filter, e.g. {"PriceArea": ["DK1"]}
+            columns: Only return these fields
+        """
         url = f"{self._base_url}/dataset/{dataset}"
         params = {
             "limit": limit,
             "sort": sort,
         }
+        if filter_json:
+            params["filter"] = json.dumps(filter_json, separators=(",", ":"))
+        if columns:
+            params["columns"] = ",".join(columns)
         
         try:
-            async with self._session.get(url, params=params) as resp:
+            async with _get_with_retry(self._session.get, url, params=params) as resp:
                 if resp.status == 200:
-                    return await resp.json()
+                    return await _json(resp)
                 _LOGGER.warning("Energinet API returned %d for %s", resp.status, dataset)
                 return None
-        except Exception as e:
+        except _REQUEST_ERRORS as e:
             _LOGGER.error("Energinet API error: %s", e)
             return None
     
+    @_ttl_cached(CACHE_TTL_SETTLEMENT)
     async def get_co2_emission(self) -> ZoneCarbonIntensity | None:
         """Get current CO2 emission intensity for Denmark."""
-        data = await self._request("CO2Emis", limit=2)
+        data = await self._request(
+            "CO2Emis",
+            limit=2,
+            sort="Minutes5UTC DESC",
+            filter_json={"PriceArea": list(_ENERGINET_PRICE_AREAS)},
+            columns=["Minutes5UTC", "PriceArea", "CO2Emission"],
+        )
         if not data or not data.get("records"):
             return None
         
@@ -2751,61 +3928,60 @@ class EnerginetClient:
             zone_name="Denmark",
             carbon_intensity=int(co2_avg),
             fossil_fuel_percentage=None,
-            timestamp=datetime.now(timezone.utc),
+            timestamp=_now_utc(),
             data_source="Energinet",
         )
     
+    @_ttl_cached(CACHE_TTL_PRICES)
     async def get_day_ahead_prices(self, price_area: str = "DK1") -> DayAheadPrice | None:
         """Get day-ahead electricity prices for Denmark.
         
         Args:
             price_area: "DK1" (West) or "DK2" (East)
         """
-        data = await self._request("Elspotprices", limit=24)
+        data = await self._request(
+            "Elspotprices",
+            filter_json={"PriceArea": [price_area]},
+            columns=["HourUTC", "PriceArea", "SpotPriceEUR"],
+        )
         if not data or not data.get("records"):
             return None
         
-        # Find latest for specified area
-        for record in data["records"]:
-            if record.get("PriceArea") == price_area:
-                return DayAheadPrice(
-                    price=record.get("SpotPriceEUR", 0),
-                    currency="EUR",
-                    price_area=price_area,
-                    timestamp=datetime.fromisoformat(record.get("HourUTC", "").replace("Z", "+00:00")),
-                    unit="EUR/MWh",
-                    data_source="Energinet",
-                )
-        return None
+        record = data["records"][0]
+        return DayAheadPrice(
+            price=record.get("SpotPriceEUR", 0),
+            currency="EUR",
+            price_area=price_area,
+            timestamp=_parse_iso(record.get("HourUTC", "")),
+            unit="EUR/MWh",
+            data_source="Energinet",
+        )
     
+    @_ttl_cached(CACHE_TTL_FORECAST)
     async def get_production_consumption(self) -> ZonePowerBreakdown | None:
         """Get production and consumption data for Denmark."""
-        data = await self._request("ProductionConsumptionSettlement", limit=10)
+        # One row per price area for the latest hour
+        data = await self._request(
+            "ProductionConsumptionSettlement",
+            limit=len(_ENERGINET_PRICE_AREAS),
+            filter_json={"PriceArea": list(_ENERGINET_PRICE_AREAS)},
+            columns=["HourUTC", "PriceArea", "GrossConsumption", *_ENERGINET_POWER_COLUMNS],
+        )
         if not data or not data.get("records"):
             return None
         
         records = data["records"]
-        # Sum up latest records for all areas
-        latest_hour = records[0].get("HourUTC") if records else None
-        
-        total_production = 0
-        total_consumption = 0
-        generation_by_source = {}
+        # Sum up latest records for all areas (an area that has not
+        # settled the hour yet is skipped rather than mixed in)
+        latest_hour = records[0].get("HourUTC")
+        latest = [record for record in records if record.get("HourUTC") == latest_hour]
         
-        for record in records:
-            if record.get("HourUTC") == latest_hour:
-                # Add generation by source
-                for key in ["OnshoreWindPower", "OffshoreWindPower", "SolarPower", 
-                           "ThermalPower", "HydroPower"]:
-                    val = record.get(key, 0) or 0
-                    fuel = key.replace("Power", "").lower()
-                    if fuel in generation_by_source:
-                        generation_by_source[fuel] += val
-                    else:
-                        generation_by_source[fuel] = val
-                    total_production += val
-                
-                total_consumption += record.get("GrossConsumption", 0) or 0
+        generation_by_source = {
+            fuel: sum(record.get(column) or 0 for record in latest)
+            for column, fuel in _ENERGINET_POWER_COLUMNS.items()
+        }
+        total_production = sum(generation_by_source.values())
+        total_consumption = sum(record.get("GrossConsumption") or 0 for record in latest)
         
         # Combine wind types
         if "onshorewind" in generation_by_source or "offshorewind" in generation_by_source:
@@ -2830,7 +4006,7 @@ class EnerginetClient:
             power_export_mw=None,
             generation_by_source=generation_by_source,
             renewable_percentage=renewable_pct,
-            timestamp=datetime.now(timezone.utc),
+            timestamp=_now_utc(),
             data_source="Energinet",
         )
 
@@ -2858,7 +4034,11 @@ class EliaClient:
     """
     
     def __init__(self, session: aiohttp.ClientSession):
-        """Initialize the client."""
+        """Initialize the client.
+        
+        Args:
+            session: Shared HAGridHTTP session (pooled keep-alive connections)
+        """
         self._session = session
         self._base_url = "https://opendata.elia.be/api/explore/v2.1"
     
@@ -2871,15 +4051,16 @@ class EliaClient:
         }
         
         try:
-            async with self._session.get(url, params=params) as resp:
+            async with _get_with_retry(self._session.get, url, params=params) as resp:
                 if resp.status == 200:
-                    return await resp.json()
+                    return await _json(resp)
                 _LOGGER.warning("Elia API returned %d for %s", resp.status, dataset)
                 return None
-        except Exception as e:
+        except _REQUEST_ERRORS as e:
             _LOGGER.error("Elia API error: %s", e)
             return None
     
+    @_ttl_cached(CACHE_TTL_SETTLEMENT)
     async def get_current_imbalance(self) -> ImbalanceData | None:
         """Get current system imbalance for Belgium.
         
@@ -2897,9 +4078,9 @@ class EliaClient:
         # Get timestamp - handle different field names
         timestamp_str = record.get("datetime", record.get("timestamp", ""))
         try:
-            timestamp = datetime.fromisoformat(timestamp_str.replace("Z", "+00:00"))
-        except (ValueError, AttributeError):
-            timestamp = datetime.now(timezone.utc)
+            timestamp = _parse_iso(timestamp_str)
+        except (ValueError, TypeError):
+            timestamp = _now_utc()
         
         return ImbalanceData(
             system_imbalance_mw=imbalance,
@@ -2910,6 +4091,7 @@ class EliaClient:
             data_source="Elia",
         )
     
+    @_ttl_cached(CACHE_TTL_SETTLEMENT)
     async def get_imbalance_prices(self) -> dict | None:
         """Get current imbalance prices for Belgium.
         
@@ -2929,6 +4111,7 @@ class EliaClient:
             "unit": "EUR/MWh",
         }
     
+    @_ttl_cached(CACHE_TTL_SETTLEMENT)
     async def get_total_load(self) -> float | None:
         """Get total load for Belgium (MW).
         
@@ -2943,7 +4126,8 @@ class EliaClient:
         # ods002 uses 'measured' for actual load value
         return record.get("measured", record.get("mostrecentforecast", record.get("totalload")))
     
-    async def get_solar_power(self) -> dict | None:
+    @_ttl_cached(CACHE_TTL_SETTLEMENT)
+    async def get_solar_power(self) -> list[dict] | None:
         """Get solar/PV power data for Belgium.
         
         Uses ods087 - Photovoltaic power production.
@@ -2953,17 +4137,18 @@ class EliaClient:
         if not data or not data.get("results"):
             return None
         
-        forecasts = []
-        for record in data["results"]:
-            forecasts.append({
+        return [
+            {
                 "datetime": record.get("datetime"),
                 "realtime_mw": record.get("realtime"),
                 "forecast_mw": record.get("mostrecentforecast"),
                 "dayahead_forecast_mw": record.get("dayahead11hforecast"),
                 "region": record.get("region"),
-            })
-        return forecasts
+            }
+            for record in data["results"]
+        ]
     
+    @_ttl_cached(CACHE_TTL_SETTLEMENT)
     async def get_wind_power(self) -> dict | None:
         """Get wind power data for Belgium.
         
@@ -2984,18 +4169,20 @@ class EliaClient:
             "datetime": record.get("datetime"),
         }
     
+    @_ttl_cached(CACHE_TTL_SETTLEMENT)
     async def get_power_breakdown(self) -> ZonePowerBreakdown | None:
         """Get power breakdown for Belgium."""
-        results = await asyncio.gather(
-            self.get_total_load(),
-            self.get_wind_power(),
-            self._request("ods087"),  # Solar/PV
-            return_exceptions=True,
+        results = await _gather_partial(
+            {
+                "load": self.get_total_load(),
+                "wind": self.get_wind_power(),
+                "solar": self._request("ods087"),  # Solar/PV
+            },
+            _BREAKDOWN_DEADLINE,
         )
-        
-        load = results[0] if not isinstance(results[0], Exception) else None
-        wind_data = results[1] if not isinstance(results[1], Exception) else None
-        solar_data = results[2] if not isinstance(results[2], Exception) else None
+        load = results["load"]
+        wind_data = results["wind"]
+        solar_data = results["solar"]
         
         generation_by_source = {}
         
@@ -3018,11 +4205,14 @@ class EliaClient:
             power_import_mw=None,
             power_export_mw=None,
             generation_by_source=generation_by_source,
-            timestamp=datetime.now(timezone.utc),
+            timestamp=_now_utc(),
             data_source="Elia",
         )
 
 
+_SMARD_RENEWABLES = frozenset(("solar", "wind_onshore", "wind_offshore", "hydro", "biomass"))
+
+
 class SMARDClient:
     """Client for SMARD API (Germany - Bundesnetzagentur).
     
@@ -3032,10 +4222,19 @@ class SMARDClient:
     Provides: Generation by source, consumption, prices, cross-border flows.
     """
     
+    # Index files only gain an entry once a week; re-read them every minute
+    _INDEX_TTL = 60.0
+    
     def __init__(self, session: aiohttp.ClientSession):
-        """Initialize the client."""
+        """Initialize the client.
+        
+        Args:
+            session: Shared HAGridHTTP session (pooled keep-alive connections)
+        """
         self._session = session
         self._base_url = "https://www.smard.de/app/chart_data"
+        # (filter ID, region) -> (fetched at (monotonic), latest timestamp)
+        self._index_cache: dict[tuple[int, str], tuple[float, int]] = {}
     
     # SMARD filter IDs for different data types
     FILTERS = {
@@ -3058,74 +4257,123 @@ class SMARDClient:
         "cross_border_de_fr": 254,
     }
     
-    async def _request(self, filter_id: int, region: str = "DE") -> dict | None:
-        """Make API request to SMARD."""
-        # Get index to find latest timestamp
+    # Per-fuel generation filters summed by get_generation_mix
+    GENERATION_FILTERS = {
+        "solar": 4068,
+        "wind_onshore": 4067,
+        "wind_offshore": 1225,
+        "hydro": 1226,
+        "biomass": 4066,
+        "nuclear": 1224,
+        "lignite": 1227,
+        "hard_coal": 1228,
+        "gas": 4071,
+        "pumped_storage": 4070,
+    }
+    
+    async def _latest_timestamp(self, filter_id: int, region: str = "DE") -> int | None:
+        """Get the newest quarter-hour chunk timestamp for a filter (cached)."""
+        key = (filter_id, region)
+        now = time.monotonic()
+        cached = self._index_cache.get(key)
+        if cached is not None and now - cached[0] < self._INDEX_TTL:
+            return cached[1]
+        
         index_url = f"{self._base_url}/{filter_id}/{region}/index_quarterhour.json"
         
         try:
-            async with self._session.get(index_url) as resp:
+            async with _get_with_retry(self._session.get, index_url) as resp:
                 if resp.status != 200:
                     _LOGGER.warning("SMARD index returned %d", resp.status)
                     return None
-                index_data = await resp.json()
-            
-            timestamps = index_data.get("timestamps", [])
-            if not timestamps:
+                index_data = await _json(resp)
+        except _REQUEST_ERRORS as e:
+            _LOGGER.error("SMARD API error: %s", e)
+            return None
+        
+        timestamps = index_data.get("timestamps", [])
+        if not timestamps:
+            return None
+        
+        self._index_cache[key] = (now, timestamps[-1])
+        return timestamps[-1]
+    
+    @staticmethod
+    def _latest_point(data: dict) -> tuple[int, float] | None:
+        """Return the newest (timestamp ms, value) pair with a value.
+        
+        Chunks cover a whole week, so the tail is null until published.
+        """
+        return next(
+            ((ts, value) for ts, value in reversed(data.get("series") or ()) if value is not None),
+            None,
+        )
+    
+    async def _request(
+        self,
+        filter_id: int,
+        region: str = "DE",
+        latest_ts: int | None = None,
+    ) -> dict | None:
+        """Make API request to SMARD.
+        
+        Args:
+            filter_id: SMARD filter ID
+            region: SMARD region code
+            latest_ts: Chunk timestamp to read; looked up from the
+                filter's index when not given
+        """
+        if latest_ts is None:
+            latest_ts = await self._latest_timestamp(filter_id, region)
+            if latest_ts is None:
                 return None
-            
-            # Get latest timestamp data
-            latest_ts = timestamps[-1]
+        
+        try:
             data_url = f"{self._base_url}/{filter_id}/{region}/{filter_id}_{region}_quarterhour_{latest_ts}.json"
             
-            async with self._session.get(data_url) as resp:
+            async with _get_with_retry(self._session.get, data_url) as resp:
                 if resp.status == 200:
-                    return await resp.json()
+                    return await _json(resp)
                 return None
-        except Exception as e:
+        except _REQUEST_ERRORS as e:
             _LOGGER.error("SMARD API error: %s", e)
             return None
     
+    @_ttl_cached(CACHE_TTL_SETTLEMENT)
     async def get_generation_mix(self) -> ZonePowerBreakdown | None:
         """Get current generation mix for Germany."""
-        # Fetch all generation types in parallel
-        filter_ids = {
-            "solar": 4068,
-            "wind_onshore": 4067,
-            "wind_offshore": 1225,
-            "hydro": 1226,
-            "biomass": 4066,
-            "nuclear": 1224,
-            "lignite": 1227,
-            "hard_coal": 1228,
-            "gas": 4071,
-            "pumped_storage": 4070,
-        }
+        # Quarter-hour chunks start at the same timestamps for every
+        # generation filter, so one index lookup serves all of them
+        latest_ts = await self._latest_timestamp(self.FILTERS["generation_total"])
+        if latest_ts is None:
+            return None
         
-        tasks = {fuel: self._request(fid) for fuel, fid in filter_ids.items()}
-        results = await asyncio.gather(*tasks.values(), return_exceptions=True)
+        # Fetch all generation types in parallel
+        results = await _gather_partial(
+            {
+                fuel: self._request(fid, latest_ts=latest_ts)
+                for fuel, fid in self.GENERATION_FILTERS.items()
+            },
+            _BREAKDOWN_DEADLINE,
+        )
         
         generation_by_source = {}
         total_production = 0
         renewable_mw = 0
         
-        for fuel, result in zip(tasks.keys(), results):
-            if isinstance(result, Exception) or not result:
+        for fuel, result in results.items():
+            if not result:
                 continue
             
-            series = result.get("series", [])
-            if series:
-                # Get latest non-null value
-                for entry in reversed(series):
-                    if entry[1] is not None:
-                        val = entry[1]
-                        generation_by_source[fuel] = val
-                        total_production += val
-                        
-                        # Track renewables
-                        if fuel in ["solar", "wind_onshore", "wind_offshore", "hydro", "biomass"]:
-                            renewable_mw += val
-                        break
+            latest = self._latest_point(result)
+            if latest is not None:
+                val = latest[1]
+                generation_by_source[fuel] = val
+                total_production += val
+                
+                # Track renewables
+                if fuel in _SMARD_RENEWABLES:
+                    renewable_mw += val
         
         # Combine wind types
         if "wind_onshore" in generation_by_source or "wind_offshore" in generation_by_source:
@@ -3145,42 +4393,38 @@ class SMARDClient:
             power_export_mw=None,
             generation_by_source=generation_by_source,
             renewable_percentage=renewable_pct,
-            timestamp=datetime.now(timezone.utc),
+            timestamp=_now_utc(),
             data_source="SMARD",
         )
     
+    @_ttl_cached(CACHE_TTL_SETTLEMENT)
     async def get_consumption(self) -> float | None:
         """Get total consumption for Germany (MW)."""
         data = await self._request(410)
         if not data:
             return None
         
-        series = data.get("series", [])
-        if series:
-            for entry in reversed(series):
-                if entry[1] is not None:
-                    return entry[1]
-        return None
+        latest = self._latest_point(data)
+        return latest[1] if latest is not None else None
     
+    @_ttl_cached(CACHE_TTL_PRICES)
     async def get_day_ahead_price(self) -> DayAheadPrice | None:
         """Get day-ahead price for Germany."""
         data = await self._request(4169)
         if not data:
             return None
         
-        series = data.get("series", [])
-        if series:
-            for entry in reversed(series):
-                if entry[1] is not None:
-                    return DayAheadPrice(
-                        price=entry[1],
-                        currency="EUR",
-                        price_area="DE",
-                        timestamp=datetime.fromtimestamp(entry[0] / 1000, tz=timezone.utc),
-                        unit="EUR/MWh",
-                        data_source="SMARD",
-                    )
-        return None
+        latest = self._latest_point(data)
+        if latest is None:
+            return None
+        return DayAheadPrice(
+            price=latest[1],
+            currency="EUR",
+            price_area="DE",
+            timestamp=datetime.fromtimestamp(latest[0] / 1000, tz=timezone.utc),
+            unit="EUR/MWh",
+            data_source="SMARD",
+        )
 
 
 # ============================================================================
@@ -3209,10 +4453,10 @@ class PSEClient:
         try:
             async with self._session.get(url) as resp:
                 if resp.status == 200:
-                    return await resp.json()
+                    return await _json(resp)
                 _LOGGER.warning("PSE API returned %d for %s", resp.status, endpoint)
                 return None
-        except Exception as e:
+        except _REQUEST_ERRORS as e:
             _LOGGER.error("PSE API error: %s", e)
             return None
     
@@ -3323,10 +4567,10 @@ class TernaClient:
         try:
             async with self._session.get(url) as resp:
                 if resp.status == 200:
-                    return await resp.json()
+                    return await _json(resp)
                 _LOGGER.warning("Terna API returned %d for %s", resp.status, endpoint)
                 return None
-        except Exception as e:
+        except _REQUEST_ERRORS as e:
             _LOGGER.error("Terna API error: %s", e)
             return None
     
@@ -3378,6 +4622,13 @@ class TernaClient:
 # ============================================================================
 
 
+# Qualified tags of the IESO GenOutputCapability report
+_IESO_GEN_NS = "{http://www.ieso.ca/schema/IMO/PDP/Report/GenOutputCapability}"
+_IESO_FUEL_TYPE = f"{_IESO_GEN_NS}FuelType"
+_IESO_FUEL = f"{_IESO_GEN_NS}Fuel"
+_IESO_OUTPUT = f"{_IESO_GEN_NS}Output"
+
+
 class IESOClient:
     """Client for IESO API (Ontario, Canada).
     
@@ -3392,17 +4643,17 @@ class IESOClient:
         self._session = session
         self._base_url = "https://www.ieso.ca"
     
-    async def _request(self, report_name: str) -> str | None:
-        """Make API request to IESO (returns XML)."""
+    async def _request(self, report_name: str) -> bytes | None:
+        """Make API request to IESO (returns raw XML bytes)."""
         url = f"{self._base_url}/publicreports/{report_name}"
         
         try:
             async with self._session.get(url) as resp:
                 if resp.status == 200:
-                    return await resp.text()
+                    return await resp.read()
                 _LOGGER.warning("IESO API returned %d for %s", resp.status, report_name)
                 return None
-        except Exception as e:
+        except _REQUEST_ERRORS as e:
             _LOGGER.error("IESO API error: %s", e)
             return None
     
@@ -3414,17 +4665,16 @@ class IESOClient:
         
         try:
             # Parse XML
-            root = ET.fromstring(xml_data)
-            ns = {"ns": "http://www.ieso.ca/schema/IMO/PDP/Report/GenOutputCapability"}
+            root = ET.fromstring(xml_data, ET.XMLParser(**_XML_PARSER_OPTIONS))
             
             generation_by_source = {}
             total = 0
             renewable_mw = 0
             
-            fuel_types = root.findall(".//ns:FuelType", ns)
-            for fuel_type in fuel_types:
-                fuel = fuel_type.find("ns:Fuel", ns)
-                output = fuel_type.find("ns:Output", ns)
+            # One tree walk on qualified tags, no XPath or prefix resolution
+            for fuel_type in root.iter(_IESO_FUEL_TYPE):
+                fuel = fuel_type.find(_IESO_FUEL)
+                output = fuel_type.find(_IESO_OUTPUT)
                 
                 if fuel is not None and output is not None:
                     fuel_name = fuel.text.lower() if fuel.text else "unknown"
@@ -3461,7 +4711,7 @@ class IESOClient:
             return None
         
         try:
-            root = ET.fromstring(xml_data)
+            root = ET.fromstring(xml_data, ET.XMLParser(**_XML_PARSER_OPTIONS))
             # Find latest demand value
             demand_elem = root.find(".//Demand")
             if demand_elem is not None and demand_elem.text:
@@ -3491,19 +4741,19 @@ class AESOClient:
         self._session = session
         self._api_key = api_key
         self._base_url = "https://api.aeso.ca"
+        self._headers = {"API-Key": api_key}
     
     async def _request(self, endpoint: str) -> dict | None:
         """Make API request to AESO."""
         url = f"{self._base_url}/{endpoint}"
-        headers = {"API-Key": self._api_key}
         
         try:
-            async with self._session.get(url, headers=headers) as resp:
+            async with self._session.get(url, headers=self._headers) as resp:
                 if resp.status == 200:
-                    return await resp.json()
+                    return await _json(resp)
                 _LOGGER.warning("AESO API returned %d for %s", resp.status, endpoint)
                 return None
-        except Exception as e:
+        except _REQUEST_ERRORS as e:
             _LOGGER.error("AESO API error: %s", e)
             return None
     
@@ -3618,7 +4868,7 @@ class TranspowerClient:
                 async with self._session.head(url) as resp:
                     if resp.status == 200:
                         return url
-            except Exception:
+            except _REQUEST_ERRORS:
                 continue
         
         return None
@@ -3772,27 +5022,30 @@ class WattTimeClient:
         self._password = password
         self._base_url = "https://api.watttime.org/v3"
         self._token: str | None = None
-        self._token_expiry: datetime | None = None
+        # Monotonic deadline, immune to wall-clock adjustments
+        self._token_expiry = 0.0
+        self._auth = aiohttp.BasicAuth(username, password)
+        self._auth_headers: dict[str, str] = {}
     
     async def _get_token(self) -> str | None:
         """Get authentication token."""
-        if self._token and self._token_expiry and datetime.now(timezone.utc) < self._token_expiry:
+        if self._token and time.monotonic() < self._token_expiry:
             return self._token
         
         url = f"{self._base_url}/login"
-        auth = aiohttp.BasicAuth(self._username, self._password)
         
         try:
-            async with self._session.get(url, auth=auth) as resp:
+            async with self._session.get(url, auth=self._auth) as resp:
                 if resp.status == 200:
-                    data = await resp.json()
+                    data = await _json(resp)
                     self._token = data.get("token")
+                    self._auth_headers = {"Authorization": f"Bearer {self._token}"}
                     # Token typically valid for 30 minutes
-                    self._token_expiry = datetime.now(timezone.utc) + timedelta(minutes=25)
+                    self._token_expiry = time.monotonic() + 25 * 60
                     return self._token
                 _LOGGER.warning("WattTime login returned %d", resp.status)
                 return None
-        except Exception as e:
+        except _REQUEST_ERRORS as e:
             _LOGGER.error("WattTime login error: %s", e)
             return None
     
@@ -3803,15 +5056,14 @@ class WattTimeClient:
             return None
         
         url = f"{self._base_url}/{endpoint}"
-        headers = {"Authorization": f"Bearer {token}"}
         
         try:
-            async with self._session.get(url, headers=headers, params=params) as resp:
+            async with self._session.get(url, headers=self._auth_headers, params=params) as resp:
                 if resp.status == 200:
-                    return await resp.json()
+                    return await _json(resp)
                 _LOGGER.warning("WattTime API returned %d for %s", resp.status, endpoint)
                 return None
-        except Exception as e:
+        except _REQUEST_ERRORS as e:
             _LOGGER.error("WattTime API error: %s", e)
             return None
     
@@ -3837,7 +5089,7 @@ class WattTimeClient:
             zone_name=data.get("region_full_name", region),
             carbon_intensity=int(data.get("value", 0)),  # WattTime uses 0-100 index
             fossil_fuel_percentage=None,
-            timestamp=datetime.fromisoformat(data.get("point_time", "").replace("Z", "+00:00")),
+            timestamp=_parse_iso(data.get("point_time", "")),
             data_source="WattTime",
         )
     
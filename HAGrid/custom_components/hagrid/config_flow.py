@@ -4,12 +4,12 @@ from __future__ import annotations
 import logging
 from typing import Any
 
-import aiohttp
 import voluptuous as vol
 from homeassistant import config_entries
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.helpers import selector
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
 from .api import CarbonIntensityClient
 from .const import (
@@ -62,17 +62,17 @@ _LOGGER = logging.getLogger(__name__)
 
 async def validate_postcode(hass: HomeAssistant, postcode: str) -> dict[str, Any]:
     """Validate postcode against Carbon Intensity API."""
-    async with aiohttp.ClientSession() as session:
-        client = CarbonIntensityClient(session)
-        data = await client.get_regional_data(postcode=postcode)
-        
-        if data:
-            return {
-                "region_id": data.region_id,
-                "region_name": data.short_name,
-                "dno": data.dno_region,
-            }
-        raise ValueError("Invalid postcode or region not found")
+    # Reuse Home Assistant's pooled session instead of opening a new one
+    client = CarbonIntensityClient(async_get_clientsession(hass))
+    data = await client.get_regional_data(postcode=postcode)
+    
+    if data:
+        return {
+            "region_id": data.region_id,
+            "region_name": data.short_name,
+            "dno": data.dno_region,
+        }
+    raise ValueError("Invalid postcode or region not found")
 
 
 class HAGridConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
@@ -3,6 +3,7 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import time
 from datetime import timedelta
 from typing import Any
 
@@ -12,6 +13,7 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 from .api import (
+    HAGridHTTP,
     CarbonIntensityClient,
     UKPNClient,
     OverpassClient,
@@ -177,6 +179,7 @@ class HAGridCoordinator(DataUpdateCoordinator):
         )
         
         # Clients will be initialized in async_config_entry_first_refresh
+        self._http = HAGridHTTP()
         self._session: aiohttp.ClientSession | None = None
         self.carbon_client: CarbonIntensityClient | None = None
         self.ukpn_client: UKPNClient | None = None
@@ -221,7 +224,8 @@ class HAGridCoordinator(DataUpdateCoordinator):
     
     async def _async_setup(self) -> None:
         """Set up the coordinator."""
-        self._session = aiohttp.ClientSession()
+        # Every client shares one pooled session
+        self._session = self._http.session
         
         # Always-available clients (no API key needed)
         self.carbon_client = CarbonIntensityClient(self._session)
@@ -394,55 +398,59 @@ class HAGridCoordinator(DataUpdateCoordinator):
                 "watttime_data": None,  # WattTime global emissions
             }
             
-            # Get regional carbon intensity data
-            if self.postcode or self.region_id:
-                data["regional_data"] = await self.carbon_client.get_regional_data(
-                    postcode=self.postcode,
-                    region_id=self.region_id,
-                )
-                
-                # Store location for OSM queries
-                if data["regional_data"]:
-                    # Use postcode geocoding from HA or approximate
-                    # For now, we'll get it from infrastructure if available
-                    pass
-                
-                # Get 24hr forecast
-                data["forecast"] = await self.carbon_client.get_intensity_forecast(
-                    hours=24,
-                    postcode=self.postcode,
-                    region_id=self.region_id,
-                )
-            
-            # Get all regions for the map
-            data["all_regions"] = await self.carbon_client.get_all_regions()
+            # Independent sources are fetched concurrently over the shared session
+            refresh_infrastructure = (
+                self.show_infrastructure
+                and time.time() - self._infrastructure_last_update
+                > self._infrastructure_update_interval
+            )
             
-            # Get live faults if enabled
+            tasks = [self._fetch_carbon_data(data)]
             if self.show_live_faults:
-                data["live_faults"] = await self.ukpn_client.get_live_faults(limit=50)
+                tasks.append(self._fetch_live_faults(data))
+            if refresh_infrastructure:
+                tasks.append(self._update_infrastructure())
+            tasks.append(self._fetch_additional_data(data))
+            
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+            
+            # Carbon intensity is the core data set; fail the update without it
+            if isinstance(results[0], Exception):
+                raise results[0]
+            for result in results[1:]:
+                if isinstance(result, Exception):
+                    _LOGGER.debug("Error fetching HAGrid data source: %s", result)
             
             # Get infrastructure data (cached, less frequent updates)
             if self.show_infrastructure:
-                import time
-                now = time.time()
-                if now - self._infrastructure_last_update > self._infrastructure_update_interval:
-                    await self._update_infrastructure()
-                    self._infrastructure_last_update = now
+                if refresh_infrastructure:
+                    self._infrastructure_last_update = time.time()
                 
                 data["substations"] = self._cached_substations
                 data["power_lines"] = self._cached_lines
                 data["embedded_generation"] = self._cached_generation
                 data["osm_features"] = self._cached_osm_features
             
-            # Fetch from additional APIs (in parallel where possible)
-            await self._fetch_additional_data(data)
-            
             return data
             
         except Exception as e:
             _LOGGER.error("Error fetching HAGrid data: %s", e)
             raise UpdateFailed(f"Error fetching data: {e}") from e
     
+    async def _fetch_carbon_data(self, data: dict[str, Any]) -> None:
+        """Fetch national and regional carbon intensity data."""
+        # All regions for the map, plus regional data and 24hr forecast
+        # when a location is configured, fetched concurrently
+        data.update(await self.carbon_client.refresh_all(
+            postcode=self.postcode,
+            region_id=self.region_id,
+            hours=24,
+        ))
+    
+    async def _fetch_live_faults(self, data: dict[str, Any]) -> None:
+        """Fetch live faults from UKPN."""
+        data["live_faults"] = await self.ukpn_client.get_live_faults(limit=50)
+    
     async def _fetch_additional_data(self, data: dict[str, Any]) -> None:
         """Fetch data from additional API sources."""
         tasks = []
@@ -518,7 +526,10 @@ class HAGridCoordinator(DataUpdateCoordinator):
             tasks.append(self._fetch_watttime_data(data))
         
         if tasks:
-            await asyncio.gather(*tasks, return_exceptions=True)
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+            for result in results:
+                if isinstance(result, Exception):
+                    _LOGGER.debug("Error fetching additional data: %s", result)
     
     async def _fetch_elexon_data(self, data: dict[str, Any]) -> None:
         """Fetch granular metered circuit data from Elexon BMRS."""
@@ -526,28 +537,23 @@ class HAGridCoordinator(DataUpdateCoordinator):
             if not self.elexon_client:
                 return
             
-            # Get comprehensive grid summary (includes all metered data)
-            grid_summary = await self.elexon_client.get_grid_summary()
+            # All three views are built from one shared snapshot (four requests)
+            (
+                snapshot,  # Generation, interconnectors, frequency and demand
+                grid_summary,  # Comprehensive summary (includes all metered data)
+                circuit_flows,  # Individual circuit flows
+            ) = await asyncio.gather(
+                self.elexon_client.get_grid_snapshot(),
+                self.elexon_client.get_grid_summary(),
+                self.elexon_client.get_circuit_flows(),
+            )
+            frequency = snapshot["frequency"]
+            demand = snapshot["demand"]  # National demand
             data["grid_summary"] = grid_summary
-            
-            # Get individual circuit flows
-            circuit_flows = await self.elexon_client.get_circuit_flows()
             data["circuit_flows"] = circuit_flows
-            
-            # Get detailed generation by fuel type
-            generation = await self.elexon_client.get_generation_by_fuel_type()
-            data["generation_by_fuel"] = generation
-            
-            # Get interconnector flows
-            interconnectors = await self.elexon_client.get_interconnector_flows()
-            data["interconnector_flows"] = interconnectors
-            
-            # Get system frequency
-            frequency = await self.elexon_client.get_system_frequency()
+            data["generation_by_fuel"] = snapshot["generation"]
+            data["interconnector_flows"] = snapshot["interconnectors"]
             data["system_frequency"] = frequency
-            
-            # Get national demand
-            demand = await self.elexon_client.get_demand_outturn()
             data["demand"] = demand
             
             _LOGGER.debug(
@@ -613,12 +619,12 @@ class HAGridCoordinator(DataUpdateCoordinator):
             
             zone = self._electricity_maps_zone
             
-            # Get carbon intensity for configured zone
-            carbon = await self.electricity_maps_client.get_carbon_intensity(zone)
+            # Get carbon intensity and power breakdown (generation mix by source)
+            carbon, power_breakdown = await asyncio.gather(
+                self.electricity_maps_client.get_carbon_intensity(zone),
+                self.electricity_maps_client.get_power_breakdown(zone),
+            )
             data["global_carbon"] = carbon
-            
-            # Get power breakdown (generation mix by source)
-            power_breakdown = await self.electricity_maps_client.get_power_breakdown(zone)
             data["global_power_breakdown"] = power_breakdown
             
             if carbon:
@@ -639,8 +645,10 @@ class HAGridCoordinator(DataUpdateCoordinator):
             region = self._eia_region
             
             # Get hourly grid monitor data (demand, generation, net imports)
-            grid_data = await self.eia_client.get_hourly_grid_monitor(region)
-            demand = await self.eia_client.get_demand(region)
+            grid_data, demand = await asyncio.gather(
+                self.eia_client.get_hourly_grid_monitor(region),
+                self.eia_client.get_demand(region),
+            )
             
             data["eia_data"] = {
                 "region": region,
@@ -666,8 +674,10 @@ class HAGridCoordinator(DataUpdateCoordinator):
             area = self._entsoe_area
             
             # Get generation by type and total load
-            generation = await self.entsoe_client.get_generation_per_type(area)
-            load = await self.entsoe_client.get_total_load(area)
+            generation, load = await asyncio.gather(
+                self.entsoe_client.get_generation_per_type(area),
+                self.entsoe_client.get_total_load(area),
+            )
             
             data["entsoe_data"] = {
                 "area": area,
@@ -691,8 +701,10 @@ class HAGridCoordinator(DataUpdateCoordinator):
             region = self._australia_region
             
             # Get network data and carbon intensity
-            network_data = await self.openelectricity_client.get_network_data(region)
-            carbon = await self.openelectricity_client.get_carbon_intensity(region)
+            network_data, carbon = await asyncio.gather(
+                self.openelectricity_client.get_network_data(region),
+                self.openelectricity_client.get_carbon_intensity(region),
+            )
             
             data["australia_data"] = {
                 "region": region,
@@ -711,8 +723,10 @@ class HAGridCoordinator(DataUpdateCoordinator):
                 return
             
             # Get generation structure and CO2-free percentage
-            generation = await self.ree_esios_client.get_generation_structure()
-            co2_free = await self.ree_esios_client.get_carbon_free_percentage()
+            generation, co2_free = await asyncio.gather(
+                self.ree_esios_client.get_generation_structure(),
+                self.ree_esios_client.get_carbon_free_percentage(),
+            )
             
             data["spain_data"] = {
                 "region": self._spain_region,
@@ -732,8 +746,10 @@ class HAGridCoordinator(DataUpdateCoordinator):
                 return
             
             # Get actual generation and consumption
-            generation = await self.rte_client.get_actual_generation()
-            consumption = await self.rte_client.get_consumption()
+            generation, consumption = await asyncio.gather(
+                self.rte_client.get_actual_generation(),
+                self.rte_client.get_consumption(),
+            )
             
             data["france_data"] = {
                 "generation": generation,
@@ -752,8 +768,10 @@ class HAGridCoordinator(DataUpdateCoordinator):
             if not self.fingrid_client:
                 return
             
-            power_breakdown = await self.fingrid_client.get_power_breakdown()
-            frequency = await self.fingrid_client.get_frequency()
+            power_breakdown, frequency = await asyncio.gather(
+                self.fingrid_client.get_power_breakdown(),
+                self.fingrid_client.get_frequency(),
+            )
             
             data["finland_data"] = {
                 "power_breakdown": power_breakdown,
@@ -775,9 +793,11 @@ class HAGridCoordinator(DataUpdateCoordinator):
             if not self.energinet_client:
                 return
             
-            co2 = await self.energinet_client.get_co2_emission()
-            power_breakdown = await self.energinet_client.get_production_consumption()
-            prices = await self.energinet_client.get_day_ahead_prices()
+            co2, power_breakdown, prices = await asyncio.gather(
+                self.energinet_client.get_co2_emission(),
+                self.energinet_client.get_production_consumption(),
+                self.energinet_client.get_day_ahead_prices(),
+            )
             
             data["denmark_data"] = {
                 "co2_emission": co2,
@@ -796,9 +816,11 @@ class HAGridCoordinator(DataUpdateCoordinator):
             if not self.elia_client:
                 return
             
-            power_breakdown = await self.elia_client.get_power_breakdown()
-            imbalance = await self.elia_client.get_current_imbalance()
-            load = await self.elia_client.get_total_load()
+            power_breakdown, imbalance, load = await asyncio.gather(
+                self.elia_client.get_power_breakdown(),
+                self.elia_client.get_current_imbalance(),
+                self.elia_client.get_total_load(),
+            )
             
             data["belgium_data"] = {
                 "power_breakdown": power_breakdown,
@@ -817,9 +839,11 @@ class HAGridCoordinator(DataUpdateCoordinator):
             if not self.smard_client:
                 return
             
-            generation_mix = await self.smard_client.get_generation_mix()
-            consumption = await self.smard_client.get_consumption()
-            price = await self.smard_client.get_day_ahead_price()
+            generation_mix, consumption, price = await asyncio.gather(
+                self.smard_client.get_generation_mix(),
+                self.smard_client.get_consumption(),
+                self.smard_client.get_day_ahead_price(),
+            )
             
             data["germany_data"] = {
                 "generation_mix": generation_mix,
@@ -850,9 +874,11 @@ class HAGridCoordinator(DataUpdateCoordinator):
             if not self.pse_client:
                 return
             
-            generation = await self.pse_client.get_generation()
-            frequency = await self.pse_client.get_frequency()
-            cross_border = await self.pse_client.get_cross_border_flows()
+            generation, frequency, cross_border = await asyncio.gather(
+                self.pse_client.get_generation(),
+                self.pse_client.get_frequency(),
+                self.pse_client.get_cross_border_flows(),
+            )
             
             data["poland_data"] = {
                 "generation": generation,
@@ -874,8 +900,10 @@ class HAGridCoordinator(DataUpdateCoordinator):
             if not self.terna_client:
                 return
             
-            generation = await self.terna_client.get_generation_by_source()
-            demand = await self.terna_client.get_real_time_demand()
+            generation, demand = await asyncio.gather(
+                self.terna_client.get_generation_by_source(),
+                self.terna_client.get_real_time_demand(),
+            )
             
             data["italy_data"] = {
                 "generation": generation,
@@ -893,8 +921,10 @@ class HAGridCoordinator(DataUpdateCoordinator):
             if not self.ieso_client:
                 return
             
-            generation = await self.ieso_client.get_generation_output()
-            demand = await self.ieso_client.get_demand()
+            generation, demand = await asyncio.gather(
+                self.ieso_client.get_generation_output(),
+                self.ieso_client.get_demand(),
+            )
             
             data["ontario_data"] = {
                 "generation": generation,
@@ -924,8 +954,10 @@ class HAGridCoordinator(DataUpdateCoordinator):
             if not self.aeso_client:
                 return
             
-            generation = await self.aeso_client.get_generation()
-            price = await self.aeso_client.get_pool_price()
+            generation, price = await asyncio.gather(
+                self.aeso_client.get_generation(),
+                self.aeso_client.get_pool_price(),
+            )
             
             data["alberta_data"] = {
                 "generation": generation,
@@ -943,8 +975,10 @@ class HAGridCoordinator(DataUpdateCoordinator):
             if not self.transpower_client:
                 return
             
-            power_data = await self.transpower_client.get_power_data()
-            hvdc = await self.transpower_client.get_hvdc_transfer()
+            power_data, hvdc = await asyncio.gather(
+                self.transpower_client.get_power_data(),
+                self.transpower_client.get_hvdc_transfer(),
+            )
             
             data["new_zealand_data"] = {
                 "power_data": power_data,
@@ -977,8 +1011,10 @@ class HAGridCoordinator(DataUpdateCoordinator):
             zone = self._electricity_maps_zone or "GB"
             
             # Try to get region from configured zone
-            carbon = await self.watttime_client.get_index(zone)
-            marginal = await self.watttime_client.get_marginal_emissions(zone)
+            carbon, marginal = await asyncio.gather(
+                self.watttime_client.get_index(zone),
+                self.watttime_client.get_marginal_emissions(zone),
+            )
             
             data["watttime_data"] = {
                 "carbon_index": carbon,
@@ -997,27 +1033,15 @@ class HAGridCoordinator(DataUpdateCoordinator):
             return
             
         try:
-            # Fetch infrastructure data in parallel
-            results = await asyncio.gather(
-                self.ukpn_client.get_grid_primary_substations(limit=200),
-                self.ukpn_client.get_secondary_substations(limit=500),
-                self.ukpn_client.get_overhead_lines_33kv(limit=200),
-                self.ukpn_client.get_overhead_lines_hv(limit=200),
-                self.ukpn_client.get_embedded_generation(limit=200),
-                return_exceptions=True,
-            )
-            
-            # Process results with type checking
-            if isinstance(results[0], list):
-                self._cached_substations = results[0]
-            if isinstance(results[1], list):
-                self._cached_substations.extend(results[1])
-            if isinstance(results[2], list):
-                self._cached_lines = results[2]
-            if isinstance(results[3], list):
-                self._cached_lines.extend(results[3])
-            if isinstance(results[4], list):
-                self._cached_generation = results[4]
+            # Fetch infrastructure data in parallel; failed datasets keep
+            # their previous cached copy
+            bundle = await self.ukpn_client.get_network_bundle()
+            if bundle["substations"] is not None:
+                self._cached_substations = bundle["substations"]
+            if bundle["lines"] is not None:
+                self._cached_lines = bundle["lines"]
+            if bundle["generation"] is not None:
+                self._cached_generation = bundle["generation"]
             
             _LOGGER.debug(
                 "Infrastructure updated: %d substations, %d lines, %d generation sites",
@@ -1063,7 +1087,7 @@ class HAGridCoordinator(DataUpdateCoordinator):
     async def async_shutdown(self) -> None:
         """Shutdown the coordinator."""
         if self._session:
-            await self._session.close()
+            await self._http.close()
             self._session = None
     
     @property
@@ -1269,7 +1293,7 @@ class HAGridCoordinator(DataUpdateCoordinator):
                     "id": l.id,
                     "type": l.line_type,
                     "voltage": l.voltage,
-                    "coordinates": l.coordinates,
+                    "coordinates": l.coordinates.tolist(),
                 }
                 for l in self.data.get("power_lines", [])
             ],
@@ -1300,9 +1324,9 @@ class HAGridCoordinator(DataUpdateCoordinator):
                     "name": o.name,
                     "operator": o.operator,
                     "voltage": o.voltage,
-                    "lat": o.lat,
-                    "lon": o.lon,
-                    "tags": o.tags,
+                    "lat": o.latitude,
+                    "lon": o.longitude,
+                    "tags": dict(o.tags),
                 }
                 for o in self.data.get("osm_features", [])
             ],
@@ -0,0 +1,77 @@
+"""Geospatial helpers for HAGrid - vectorised coordinate conversion."""
+from __future__ import annotations
+
+from itertools import chain
+from typing import Any, Sequence
+
+import numpy as np
+
+try:
+    from pyproj import Transformer
+    
+    # British National Grid (OSGB36) eastings/northings -> WGS84 lon/lat
+    _OSGB_TO_WGS = Transformer.from_crs("EPSG:27700", "EPSG:4326", always_xy=True)
+except ImportError:
+    _OSGB_TO_WGS = None
+
+
+def _flatten_vertices(segments: Sequence[Sequence[Sequence[float]]]) -> np.ndarray:
+    """Pack GeoJSON vertex lists into one (n, 2) float64 array of (lon, lat).
+    
+    np.fromiter over a flat chain of the values is several times faster
+    than np.asarray on nested lists, which inspects every sublist first.
+    Only the first two values of each vertex are taken, since GeoJSON
+    allows 2D and 3D positions to be mixed within one geometry.
+    """
+    count = sum(map(len, segments))
+    if not count:
+        return np.empty((0, 2), dtype=np.float64)
+    flat = chain.from_iterable((v[0], v[1]) for seg in segments for v in seg)
+    return np.fromiter(flat, dtype=np.float64, count=count * 2).reshape(count, 2)
+
+
+def geojson_line_latlon(geo_shape: dict[str, Any]) -> np.ndarray | None:
+    """Convert a GeoJSON (Multi)LineString to an (n, 2) array of (lat, lon).
+    
+    GeoJSON stores vertices as [lon, lat(, alt)]; the swap is a single
+    strided view rather than one Python tuple per vertex. MultiLineString
+    segments are concatenated in order.
+    
+    Returns:
+        Vertex array, or None for any other geometry type
+    """
+    coords = geo_shape.get("coordinates")
+    if not coords:
+        return None
+    
+    shape_type = geo_shape.get("type")
+    if shape_type == "LineString":
+        arr = _flatten_vertices((coords,))
+    elif shape_type == "MultiLineString":
+        arr = _flatten_vertices(coords)
+    else:
+        return None
+    return arr[:, ::-1]
+
+
+def osgb_to_latlon(
+    eastings: np.ndarray,
+    northings: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Convert British National Grid coordinates to WGS84 in one batch.
+    
+    Uses pyproj when installed (accurate to a few metres); otherwise falls
+    back to a rough linear approximation that is only good for placing a
+    marker in the right part of the country.
+    
+    Args:
+        eastings: OSGB36 eastings in metres
+        northings: OSGB36 northings in metres
+        
+    Returns:
+        Tuple of (latitudes, longitudes) arrays
+    """
+    if _OSGB_TO_WGS is not None:
+        lon, lat = _OSGB_TO_WGS.transform(eastings, northings)
+        return np.asarray(lat), np.asarray(lon)
+    return 49.0 + northings / 111000, -8.0 + eastings / 80000
@@ -0,0 +1,37 @@
+"""Shared fixtures for HAGrid tests."""
+from __future__ import annotations
+
+import importlib
+import sys
+import types
+from pathlib import Path
+
+import pytest
+
+_INTEGRATION_DIR = Path(__file__).parent.parent / "custom_components" / "hagrid"
+
+
+def _import(module: str) -> types.ModuleType:
+    """Import an integration module without running the package __init__.
+
+    The API clients and geo helpers only need aiohttp and numpy, so the
+    package is registered on its own rather than through its __init__
+    (which sets up the Home Assistant integration).
+    """
+    if "hagrid" not in sys.modules:
+        package = types.ModuleType("hagrid")
+        package.__path__ = [str(_INTEGRATION_DIR)]
+        sys.modules["hagrid"] = package
+    return importlib.import_module(f"hagrid.{module}")
+
+
+@pytest.fixture(scope="session")
+def hagrid_api() -> types.ModuleType:
+    """The integration's API module."""
+    return _import("api")
+
+
+@pytest.fixture(scope="session")
+def hagrid_geo() -> types.ModuleType:
+    """The integration's geo helpers."""
+    return _import("geo")
@@ -0,0 +1,69 @@
+"""Tests for the Fingrid client's response handling."""
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Any
+
+import pytest
+
+
+class FakeResponse:
+    """Minimal stand-in for a 200 aiohttp.ClientResponse."""
+
+    status = 200
+    headers: dict[str, str] = {}
+
+    def __init__(self, body: bytes) -> None:
+        self._body = body
+
+    async def read(self) -> bytes:
+        return self._body
+
+    def release(self) -> None:
+        pass
+
+
+class FakeSession:
+    """Session whose get always answers with the same body."""
+
+    def __init__(self, body: bytes) -> None:
+        self._body = body
+        self.calls = 0
+
+    async def get(self, url: str, **kwargs: Any) -> FakeResponse:
+        self.calls += 1
+        return FakeResponse(self._body)
+
+
+def _request_many(hagrid_api, body: bytes) -> dict:
+    client = hagrid_api.FingridClient(FakeSession(body), "key")
+    return asyncio.run(client._request_many([74, 75]))
+
+
+def test_events_are_keyed_by_dataset(hagrid_api) -> None:
+    """A list of events is mapped by variable_id, skipping malformed entries."""
+    body = b'[{"variable_id": 74, "value": 9000}, "junk", {"value": 1}]'
+
+    assert _request_many(hagrid_api, body) == {74: {"variable_id": 74, "value": 9000}}
+
+
+@pytest.mark.parametrize("body", [b"null", b'{"message": "Forbidden"}'])
+def test_unexpected_shape_is_logged(hagrid_api, caplog, body: bytes) -> None:
+    """A non-list body returns no events and logs a warning instead of raising."""
+    with caplog.at_level(logging.WARNING):
+        assert _request_many(hagrid_api, body) == {}
+
+    assert "Unexpected Fingrid response" in caplog.text
+
+
+def test_getters_are_cached_per_instance(hagrid_api) -> None:
+    """A second poll inside the TTL is served without another request."""
+    session = FakeSession(b'[{"variable_id": 75, "value": 1200.0}]')
+    client = hagrid_api.FingridClient(session, "key")
+
+    async def poll_twice() -> list[float | None]:
+        return [await client.get_wind_power(), await client.get_wind_power()]
+
+    assert asyncio.run(poll_twice()) == [1200.0, 1200.0]
+    assert session.calls == 1
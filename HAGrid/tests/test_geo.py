@@ -0,0 +1,32 @@
+"""Tests for the geospatial helpers."""
+from __future__ import annotations
+
+import numpy as np
+
+
+def test_line_swaps_to_lat_lon(hagrid_geo) -> None:
+    """LineString vertices come back as (lat, lon) pairs."""
+    arr = hagrid_geo.geojson_line_latlon(
+        {"type": "LineString", "coordinates": [[0.1, 51.0], [0.2, 52.0]]}
+    )
+
+    np.testing.assert_array_equal(arr, [[51.0, 0.1], [52.0, 0.2]])
+
+
+def test_mixed_2d_and_3d_vertices(hagrid_geo) -> None:
+    """Altitudes are dropped per vertex, whatever the first vertex looks like."""
+    multi = hagrid_geo.geojson_line_latlon({
+        "type": "MultiLineString",
+        "coordinates": [[[0.1, 51.0], [0.2, 52.0, 30.0]], [[0.3, 53.0]]],
+    })
+    line = hagrid_geo.geojson_line_latlon(
+        {"type": "LineString", "coordinates": [[0.1, 51.0, 30.0], [0.2, 52.0]]}
+    )
+
+    np.testing.assert_array_equal(multi, [[51.0, 0.1], [52.0, 0.2], [53.0, 0.3]])
+    np.testing.assert_array_equal(line, [[51.0, 0.1], [52.0, 0.2]])
+
+
+def test_other_geometries_are_ignored(hagrid_geo) -> None:
+    """Non-line geometries return None."""
+    assert hagrid_geo.geojson_line_latlon({"type": "Point", "coordinates": [0.1, 51.0]}) is None
@@ -0,0 +1,56 @@
+"""Tests for the Overpass client's status handling."""
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Any
+
+import pytest
+
+
+class FakeResponse:
+    """Non-200 aiohttp.ClientResponse stand-in usable with ``async with``."""
+
+    def __init__(self, status: int) -> None:
+        self.status = status
+
+    async def __aenter__(self) -> FakeResponse:
+        return self
+
+    async def __aexit__(self, *exc: Any) -> None:
+        pass
+
+
+class FakeSession:
+    """Session whose post always answers with the same status."""
+
+    def __init__(self, status: int) -> None:
+        self._status = status
+
+    def post(self, url: str, **kwargs: Any) -> FakeResponse:
+        return FakeResponse(self._status)
+
+
+async def _elements(client: Any) -> list:
+    return [element async for element in client._iter_elements("[out:json];")]
+
+
+@pytest.mark.parametrize("streaming", [True, False])
+@pytest.mark.parametrize(
+    ("status", "level"),
+    [(429, logging.WARNING), (504, logging.WARNING), (500, logging.ERROR)],
+)
+def test_status_logging_matches_across_paths(
+    hagrid_api, monkeypatch, caplog, streaming: bool, status: int, level: int
+) -> None:
+    """Load shedding is a warning and other failures an error, with or without ijson."""
+    if not streaming:
+        monkeypatch.setattr(hagrid_api, "ijson", None)
+    elif hagrid_api.ijson is None:
+        pytest.skip("ijson not installed")
+    client = hagrid_api.OverpassClient(FakeSession(status))
+
+    with caplog.at_level(logging.WARNING):
+        assert asyncio.run(_elements(client)) == []
+
+    assert [record.levelno for record in caplog.records] == [level]
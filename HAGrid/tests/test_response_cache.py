@@ -0,0 +1,64 @@
+"""Tests for the shared upstream response cache."""
+from __future__ import annotations
+
+import pytest
+
+
+@pytest.fixture
+def cache(hagrid_api):
+    """A fresh response cache."""
+    return hagrid_api._ResponseCache()
+
+
+def test_max_age_cannot_extend_caller_ttl(cache, hagrid_api, monkeypatch) -> None:
+    """A long upstream max-age is capped at the caller's TTL."""
+    now = [1000.0]
+    monkeypatch.setattr(hagrid_api.time, "monotonic", lambda: now[0])
+    cache.put(("live",), "v", {"Cache-Control": "max-age=3600"}, 60)
+
+    now[0] += 61
+
+    assert cache.get(("live",)) is None
+
+
+def test_max_age_shortens_caller_ttl(cache, hagrid_api, monkeypatch) -> None:
+    """A shorter upstream max-age wins over the caller's TTL."""
+    now = [1000.0]
+    monkeypatch.setattr(hagrid_api.time, "monotonic", lambda: now[0])
+    cache.put(("k",), "v", {"Cache-Control": "max-age=10"}, 300)
+
+    now[0] += 11
+
+    assert cache.get(("k",)) is None
+
+
+def test_etag_only_entry_stays_stale(cache) -> None:
+    """ttl=0 entries are kept only for revalidation, whatever max-age says."""
+    headers = {"Cache-Control": "max-age=3600", "ETag": '"abc"'}
+    cache.put(("k",), "v", headers, 0)
+
+    assert cache.get(("k",)) is None
+    assert cache.conditional_headers(("k",)) == {"If-None-Match": '"abc"'}
+    assert cache.revalidate(("k",), 0, headers) == "v"
+    assert cache.get(("k",)) is None
+
+
+def test_revalidate_applies_the_same_cap(cache, hagrid_api, monkeypatch) -> None:
+    """A 304 refreshes the entry for min(max-age, TTL), like a 200 would."""
+    now = [1000.0]
+    monkeypatch.setattr(hagrid_api.time, "monotonic", lambda: now[0])
+    cache.put(("k",), "v", {"ETag": '"abc"'}, 60)
+    now[0] += 61
+
+    assert cache.revalidate(("k",), 60, {"Cache-Control": "max-age=5"}) == "v"
+    now[0] += 4
+    assert cache.get(("k",)) == "v"
+    now[0] += 2
+    assert cache.get(("k",)) is None
+
+
+def test_no_store_is_not_cached(cache) -> None:
+    """Cache-Control no-store responses are never stored."""
+    cache.put(("k",), "v", {"Cache-Control": "no-store"}, 300)
+
+    assert cache.get(("k",)) is None
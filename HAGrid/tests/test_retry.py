@@ -0,0 +1,96 @@
+"""Tests for the shared retry helper in the API module."""
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import pytest
+
+
+class FakeResponse:
+    """Minimal stand-in for aiohttp.ClientResponse."""
+
+    def __init__(self, status: int, headers: dict[str, str] | None = None) -> None:
+        self.status = status
+        self.headers = headers or {}
+        self.released = False
+
+    def release(self) -> None:
+        self.released = True
+
+
+class FakeGet:
+    """Bound session.get replacement returning canned statuses in order."""
+
+    def __init__(self, *responses: FakeResponse) -> None:
+        self._responses = list(responses)
+        self.calls = 0
+
+    async def __call__(self, url: str, **kwargs: Any) -> FakeResponse:
+        response = self._responses[min(self.calls, len(self._responses) - 1)]
+        self.calls += 1
+        return response
+
+
+@pytest.fixture
+def sleeps(monkeypatch: pytest.MonkeyPatch, hagrid_api) -> list[float]:
+    """Record retry sleeps instead of waiting, and drop the jitter."""
+    slept: list[float] = []
+
+    async def fake_sleep(delay: float) -> None:
+        slept.append(delay)
+
+    monkeypatch.setattr(hagrid_api.asyncio, "sleep", fake_sleep)
+    monkeypatch.setattr(hagrid_api.random, "uniform", lambda a, b: b)
+    return slept
+
+
+async def _status(hagrid_api, get: FakeGet) -> int:
+    async with hagrid_api._get_with_retry(get, "https://example.invalid") as response:
+        return response.status
+
+
+def test_retries_until_success(hagrid_api, sleeps: list[float]) -> None:
+    """Transient failures are retried and the good response is yielded."""
+    get = FakeGet(FakeResponse(503), FakeResponse(429), FakeResponse(200))
+
+    assert asyncio.run(_status(hagrid_api, get)) == 200
+    assert get.calls == 3
+    assert len(sleeps) == 2
+
+
+def test_persistent_failure_stays_within_budget(hagrid_api, sleeps: list[float]) -> None:
+    """A host that keeps failing costs at most the retry budget in sleeps."""
+    get = FakeGet(FakeResponse(503))
+
+    assert asyncio.run(_status(hagrid_api, get)) == 503
+    assert get.calls <= hagrid_api._RETRY_ATTEMPTS
+    assert sum(sleeps) <= hagrid_api._RETRY_BUDGET
+
+
+def test_long_retry_after_gives_up(hagrid_api, sleeps: list[float]) -> None:
+    """A Retry-After beyond the budget returns the 429 without waiting."""
+    get = FakeGet(FakeResponse(429, {"Retry-After": "3600"}), FakeResponse(200))
+
+    assert asyncio.run(_status(hagrid_api, get)) == 429
+    assert get.calls == 1
+    assert sleeps == []
+
+
+def test_retry_after_exhausting_budget_stops(hagrid_api, sleeps: list[float]) -> None:
+    """Retry-After delays that fit individually stop once the total would not."""
+    retry_after = FakeResponse(503, {"Retry-After": "3"})
+    get = FakeGet(retry_after, retry_after, FakeResponse(200))
+
+    assert asyncio.run(_status(hagrid_api, get)) == 503
+    assert get.calls == 2
+    assert len(sleeps) == 1
+
+
+def test_client_errors_are_not_retried(hagrid_api, sleeps: list[float]) -> None:
+    """Non-transient 4xx responses are yielded straight away."""
+    get = FakeGet(FakeResponse(404), FakeResponse(200))
+
+    assert asyncio.run(_status(hagrid_api, get)) == 404
+    assert get.calls == 1
+    assert sleeps == []
@@ -0,0 +1,55 @@
+"""Tests for the single-flight request decorator."""
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import pytest
+
+
+@pytest.fixture
+def client(hagrid_api) -> Any:
+    """A client whose decorated _request counts the calls it makes."""
+
+    class Client:
+        def __init__(self) -> None:
+            self.calls = 0
+
+        @hagrid_api._single_flight
+        async def _request(self, endpoint: str, params: dict | None = None) -> dict:
+            self.calls += 1
+            await asyncio.sleep(0)
+            return {"endpoint": endpoint, "params": params}
+
+    return Client()
+
+
+def test_concurrent_calls_share_one_request(client) -> None:
+    """Identical concurrent calls, including keyword params, make one request."""
+
+    async def run() -> list[dict]:
+        return await asyncio.gather(
+            client._request("/latest", params={"zone": "GB"}),
+            client._request("/latest", params={"zone": "GB"}),
+        )
+
+    first, second = asyncio.run(run())
+
+    assert client.calls == 1
+    assert first is second
+    assert first == {"endpoint": "/latest", "params": {"zone": "GB"}}
+
+
+def test_different_params_are_not_coalesced(client) -> None:
+    """Calls differing in a keyword argument each make their own request."""
+
+    async def run() -> list[dict]:
+        return await asyncio.gather(
+            client._request("/latest", params={"zone": "GB"}),
+            client._request("/latest", params={"zone": "FR"}),
+        )
+
+    gb, fr = asyncio.run(run())
+
+    assert client.calls == 2
+    assert (gb["params"], fr["params"]) == ({"zone": "GB"}, {"zone": "FR"})